@@ -0,0 +1,395 @@
+"""
+Shared face detection pipeline for the camera_vision demos.
+
+The face detector setup, detection helpers, drawing code, and webcam
+capture used to be copy-pasted across the demo scripts. They live here
+now so an optimization (or a bug fix) lands in one place and every demo
+picks it up.
+
+Import from a demo script with:
+
+    from _face_common import init_face_detector, detect_faces, ...
+
+The scripts are run directly (python face_detection_demo.py), so the
+import is a plain same-directory module import - no package needed.
+"""
+
+import os
+import queue
+import threading
+import time
+
+import cv2
+import numpy as np
+
+# Numba is optional - without it the geometry helpers run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+# YuNet DNN face detector model (much faster than Haar cascade)
+# Download: https://github.com/opencv/opencv_zoo/tree/main/models/face_detection_yunet
+YUNET_MODEL_PATH = os.path.join(
+    os.path.dirname(__file__), 'face_detection_yunet_2023mar.onnx'
+)
+YUNET_SCORE_THRESHOLD = 0.7  # Minimum confidence for a detection
+
+# LBP cascade: integer features instead of Haar stumps - roughly twice
+# the cascade throughput, and they map much better onto byte SIMD lanes
+USE_LBP = True
+LBP_CASCADE_PATH = cv2.data.haarcascades + 'lbpcascade_frontalface_improved.xml'
+
+# Face detection parameters (cascade fallback)
+SCALE_FACTOR = 1.2  # How much to reduce image size at each scale - 1.2
+                    # walks fewer pyramid levels than 1.1 for ~30% less work
+MIN_NEIGHBORS = 5   # How many neighbors each candidate rectangle should have
+MIN_SIZE = (50, 50)  # Minimum face size (at full resolution)
+
+# Run the cascade on a downscaled frame - the cascade is O(pixels), so
+# half resolution cuts the work ~4x. Rectangles are rescaled back after.
+DETECT_SCALE = 0.5
+MIN_SIZE_SCALED = (int(MIN_SIZE[0] * DETECT_SCALE), int(MIN_SIZE[1] * DETECT_SCALE))
+
+# Webcam capture settings - MJPG + VGA keeps the USB payload small and
+# lets the driver sustain 30 FPS
+CAPTURE_WIDTH = 640
+CAPTURE_HEIGHT = 480
+
+# Display parameters
+FACE_COLOR = (0, 255, 0)  # Green rectangle for faces
+TEXT_COLOR = (0, 255, 0)   # Green text
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# Enable OpenCL (T-API) so UMat operations can run on the integrated GPU
+cv2.ocl.setUseOpenCL(True)
+
+# Make OpenCV's internal parallelism explicit: keep the SIMD-optimized
+# kernels on, and pin the worker count to the physical cores so the
+# cascade's parallel_for_ doesn't oversubscribe efficiency cores
+cv2.setUseOptimized(True)
+cv2.setNumThreads(os.cpu_count() // 2 or 1)
+
+
+# ============================================================
+# FACE DETECTION
+# ============================================================
+
+# Cached detector - lets a warmup thread pay the model/XML load cost
+# while the operator is still reading the startup prompt
+_detector = None
+
+
+def init_face_detector():
+    """
+    Initialize OpenCV face detector.
+
+    Prefers the YuNet DNN detector (SIMD-friendly convolution pipeline,
+    several times faster per frame than the Haar cascade). Falls back to
+    the LBP cascade, then Haar, if the ONNX model file is not available.
+
+    The detector is created once and cached, so this is safe to call
+    early (e.g. from a warmup thread) and again from the demo loop.
+
+    Returns:
+        cv2.FaceDetectorYN or cv2.CascadeClassifier: Face detector
+    """
+    global _detector
+    if _detector is not None:
+        return _detector
+
+    if hasattr(cv2, 'FaceDetectorYN_create') and os.path.exists(YUNET_MODEL_PATH):
+        _detector = cv2.FaceDetectorYN_create(
+            YUNET_MODEL_PATH,
+            "",
+            (320, 240),  # Placeholder - updated to frame size in detect_faces
+            score_threshold=YUNET_SCORE_THRESHOLD
+        )
+        return _detector
+
+    # Prefer the LBP cascade when available - not every OpenCV build
+    # ships it, so an empty classifier falls through to Haar below
+    if USE_LBP:
+        lbp_cascade = cv2.CascadeClassifier(LBP_CASCADE_PATH)
+        if not lbp_cascade.empty():
+            print("⚠️  YuNet model not found - falling back to LBP cascade")
+            _detector = lbp_cascade
+            return _detector
+
+    print("⚠️  YuNet model not found - falling back to Haar cascade")
+    face_cascade = cv2.CascadeClassifier(
+        cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+    )
+    if face_cascade.empty():
+        raise RuntimeError("Failed to load Haar Cascade face detector!")
+    _detector = face_cascade
+    return _detector
+
+
+def detect_faces(detector, frame, gray_buf=None):
+    """
+    Detect faces in a frame.
+
+    Args:
+        detector: Face detector from init_face_detector()
+        frame: Image frame (BGR)
+        gray_buf: Optional persistent grayscale buffer (cv2.UMat)
+
+    Returns:
+        list: List of face rectangles [(x, y, w, h), ...]
+    """
+    if isinstance(detector, cv2.CascadeClassifier):
+        # Wrap the frame in a UMat so the grayscale conversion and the
+        # resize below run via OpenCL when a device is available. gray_buf
+        # is the caller's persistent buffer - reusing it avoids a ~1 MB
+        # allocation per call.
+        gray = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2GRAY, dst=gray_buf)
+
+        # Downscale before detection, rescale rectangles back after
+        small = cv2.resize(
+            gray, None,
+            fx=DETECT_SCALE, fy=DETECT_SCALE,
+            interpolation=cv2.INTER_AREA
+        )
+        faces = detector.detectMultiScale(
+            small,
+            scaleFactor=SCALE_FACTOR,
+            minNeighbors=MIN_NEIGHBORS,
+            minSize=MIN_SIZE_SCALED
+        )
+        if len(faces) == 0:
+            return faces
+        return (faces / DETECT_SCALE).astype(int)
+
+    # YuNet works directly on the BGR frame (no grayscale conversion)
+    frame_height, frame_width = frame.shape[:2]
+    detector.setInputSize((frame_width, frame_height))
+    _, faces = detector.detect(frame)
+
+    if faces is None:
+        return []
+
+    # Rows are [x, y, w, h, score, landmarks...] - keep the rectangle part
+    return faces[:, :4].astype(int)
+
+
+def draw_face_detection(frame, faces, emotion_state=None):
+    """
+    Draw rectangles around detected faces and add labels.
+
+    Args:
+        frame: Image frame to draw on
+        faces: List of face rectangles
+        emotion_state: Optional emotion name to show on the frame
+
+    Returns:
+        frame: Frame with face detections drawn
+    """
+    if len(faces) > 0:
+        # One vectorized pass for the corner/center arithmetic instead
+        # of unpacking each rect in Python
+        rects = np.asarray(faces, dtype=np.int32)
+        corners = rects[:, :2] + rects[:, 2:]
+        centers = rects[:, :2] + rects[:, 2:] // 2
+
+        # Per-face labels become noise (and putText cost) beyond a few
+        draw_labels = len(rects) <= 3
+
+        for i in range(len(rects)):
+            cv2.rectangle(frame, tuple(rects[i, :2]), tuple(corners[i]),
+                          FACE_COLOR, 2)
+            cv2.circle(frame, tuple(centers[i]), 5, FACE_COLOR, -1)
+            if draw_labels:
+                cv2.putText(frame, f"Face {i + 1}",
+                            (rects[i, 0], rects[i, 1] - 10),
+                            FONT, 0.5, TEXT_COLOR, 2)
+
+    # Show current emotion state (emotion demos only)
+    if emotion_state is not None:
+        emotion_text = f"Emotion: {emotion_state}"
+        cv2.putText(frame, emotion_text, (10, 150), FONT, 0.6, (255, 255, 0), 2)
+
+    return frame
+
+
+def get_largest_face(faces):
+    """
+    Get the largest face (by area) from detected faces.
+
+    Args:
+        faces: List of face rectangles
+
+    Returns:
+        tuple: (x, y, w, h) of largest face, or None if no faces
+    """
+    if len(faces) == 0:
+        return None
+    faces = np.asarray(faces)
+    # Single face is the common case in these demos - skip the argmax
+    if len(faces) == 1:
+        return faces[0]
+    # Multiply the w and h columns directly in C; int64 avoids overflow
+    return faces[(faces[:, 2].astype(np.int64) * faces[:, 3]).argmax()]
+
+
+def calculate_head_yaw_from_face(face_rect, frame_width, max_yaw=30.0):
+    """
+    Calculate robot head yaw based on face position in frame.
+
+    Args:
+        face_rect: (x, y, w, h) of face
+        frame_width: Width of camera frame
+        max_yaw: Yaw clamp in degrees
+
+    Returns:
+        float: Yaw angle in degrees (-max_yaw to +max_yaw)
+    """
+    if face_rect is None:
+        return 0.0
+
+    x, y, w, h = face_rect
+    face_center_x = x + w // 2
+    frame_center_x = frame_width // 2
+    offset_x = face_center_x - frame_center_x
+
+    max_pixels = frame_width // 2
+    yaw = (offset_x / max_pixels) * max_yaw
+    yaw = max(-max_yaw, min(max_yaw, yaw))
+
+    return yaw
+
+
+def should_track_face(face_rect, frame_width, threshold):
+    """
+    Determine if robot should move head to track face.
+
+    Only track if face is significantly off-center.
+
+    Args:
+        face_rect: (x, y, w, h) of face
+        frame_width: Width of camera frame
+        threshold: Pixel offset above which tracking should kick in
+
+    Returns:
+        bool: True if should track
+    """
+    if face_rect is None:
+        return False
+
+    x, y, w, h = face_rect
+    face_center_x = x + w // 2
+    frame_center_x = frame_width // 2
+    offset = abs(face_center_x - frame_center_x)
+
+    return offset > threshold
+
+
+@njit(cache=True, nogil=True)
+def analyze_faces(faces, frame_width, threshold, max_yaw):
+    """
+    Single compiled pass over the face rects: find the largest face and
+    compute its head yaw and track flag without per-frame list building.
+
+    Args:
+        faces: (N, 4) int32 array of (x, y, w, h) rects, N >= 1
+        frame_width: Width of camera frame
+        threshold: Pixel offset above which tracking should kick in
+        max_yaw: Yaw clamp in degrees
+
+    Returns:
+        tuple: (largest_idx, yaw, should_track)
+    """
+    largest_idx = 0
+    largest_area = 0
+    for i in range(faces.shape[0]):
+        area = faces[i, 2] * faces[i, 3]
+        if area > largest_area:
+            largest_area = area
+            largest_idx = i
+
+    face_center_x = faces[largest_idx, 0] + faces[largest_idx, 2] // 2
+    offset = face_center_x - frame_width // 2
+
+    yaw = (offset / (frame_width // 2)) * max_yaw
+    yaw = max(-max_yaw, min(max_yaw, yaw))
+
+    return largest_idx, yaw, abs(offset) > threshold
+
+
+# ============================================================
+# WEBCAM CAPTURE
+# ============================================================
+
+def init_webcam(width=CAPTURE_WIDTH, height=CAPTURE_HEIGHT):
+    """
+    Initialize Mac webcam using OpenCV.
+
+    Args:
+        width: Requested capture width (default VGA)
+        height: Requested capture height
+
+    Returns:
+        cv2.VideoCapture: Webcam capture object
+    """
+    print("📷 Opening Mac webcam...")
+
+    # Try to open default webcam (index 0)
+    cap = cv2.VideoCapture(0)
+
+    if not cap.isOpened():
+        raise RuntimeError("Failed to open webcam! Make sure it's not in use by another app.")
+
+    # Request MJPG before setting the resolution - compressed frames
+    # move ~10x less data over USB and decode via SIMD libjpeg-turbo
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_FPS, 30)
+
+    # Don't let the driver hoard stale frames - we only want the latest
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    # Get actual resolution
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    print(f"✅ Webcam opened: {width}x{height}")
+
+    return cap
+
+
+def start_capture_thread(webcam):
+    """
+    Start a daemon thread that keeps only the latest webcam frame.
+
+    webcam.read() blocks on the driver for up to a full frame interval;
+    running it on its own thread lets capture overlap detection and
+    display instead of serializing with them.
+
+    Returns:
+        queue.Queue: 1-slot queue holding the most recent frame
+    """
+    frame_queue = queue.Queue(maxsize=1)
+
+    def capture_loop():
+        while True:
+            ret, frame = webcam.read()
+            if not ret:
+                time.sleep(0.1)
+                continue
+            # Drop the stale frame so the consumer always gets the newest
+            if frame_queue.full():
+                try:
+                    frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+            frame_queue.put(frame)
+
+    threading.Thread(target=capture_loop, daemon=True).start()
+    return frame_queue
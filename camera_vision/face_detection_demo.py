@@ -1,8 +1,9 @@
 """
 Face Detection Demo - Robot detects and looks at faces
 
-This demo uses OpenCV's Haar Cascade classifier to detect faces in the
-camera feed and makes the robot turn its head to look at detected faces.
+This demo uses OpenCV's YuNet DNN face detector (with a Haar Cascade
+fallback) to detect faces in the camera feed and makes the robot turn
+its head to look at detected faces.
 
 Features:
 - Real-time face detection
@@ -20,10 +21,23 @@ Usage:
 
 from reachy_mini import ReachyMini
 from reachy_mini.utils import create_head_pose
+import concurrent.futures
 import cv2
+import os
+import threading
 import time
 import numpy as np
 
+# Shared face pipeline - detector setup, detection, drawing, geometry
+from _face_common import (
+    FONT,
+    TEXT_COLOR,
+    analyze_faces,
+    detect_faces,
+    draw_face_detection,
+    init_face_detector,
+)
+
 # ============================================================
 # CONSTANTS
 # ============================================================
@@ -34,186 +48,22 @@ REACHY MINI - FACE DETECTION DEMO
 ==================================================
 """
 
-# Face detection parameters
-SCALE_FACTOR = 1.1  # How much to reduce image size at each scale
-MIN_NEIGHBORS = 5   # How many neighbors each candidate rectangle should have
-MIN_SIZE = (50, 50)  # Minimum face size
+# Detection cadence - head motion is gated at ~2 Hz anyway, so running
+# the detector on every frame wastes cycles. Reuse the last result between.
+DETECT_EVERY = 3  # Run the detector on every Nth frame
+HUD_REFRESH = 5   # Rebuild the HUD string only every Nth frame
+
+# Headless runs pace themselves to this frame budget instead of a GUI
+HEADLESS_FRAME_DT = 1.0 / 30
 
 # Robot tracking parameters
 TRACKING_THRESHOLD = 30  # Only move head if face is this many pixels from center
 TRACKING_SPEED = 0.5     # Duration for head movements (seconds)
+MAX_YAW = 30.0           # Head yaw clamp (degrees)
 
-# Display parameters
-FACE_COLOR = (0, 255, 0)  # Green rectangle for faces
-TEXT_COLOR = (0, 255, 0)   # Green text
-FONT = cv2.FONT_HERSHEY_SIMPLEX
-
-
-# ============================================================
-# FACE DETECTION
-# ============================================================
-
-def init_face_detector():
-    """
-    Initialize OpenCV face detector using Haar Cascade.
-
-    Returns:
-        cv2.CascadeClassifier: Face detector
-    """
-    # Load the pre-trained Haar Cascade face detector
-    face_cascade = cv2.CascadeClassifier(
-        cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-    )
-
-    if face_cascade.empty():
-        raise RuntimeError("Failed to load Haar Cascade face detector!")
-
-    return face_cascade
-
-
-def detect_faces(face_cascade, frame):
-    """
-    Detect faces in a frame.
-
-    Args:
-        face_cascade: OpenCV cascade classifier
-        frame: Image frame (BGR)
-
-    Returns:
-        list: List of face rectangles [(x, y, w, h), ...]
-    """
-    # Convert to grayscale (Haar cascades work on grayscale)
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-    # Detect faces
-    faces = face_cascade.detectMultiScale(
-        gray,
-        scaleFactor=SCALE_FACTOR,
-        minNeighbors=MIN_NEIGHBORS,
-        minSize=MIN_SIZE
-    )
-
-    return faces
-
-
-def draw_face_detection(frame, faces):
-    """
-    Draw rectangles around detected faces and add labels.
-
-    Args:
-        frame: Image frame to draw on
-        faces: List of face rectangles
-
-    Returns:
-        frame: Frame with face detections drawn
-    """
-    for i, (x, y, w, h) in enumerate(faces):
-        # Draw rectangle around face
-        cv2.rectangle(frame, (x, y), (x + w, y + h), FACE_COLOR, 2)
-
-        # Add label
-        label = f"Face {i + 1}"
-        cv2.putText(
-            frame,
-            label,
-            (x, y - 10),
-            FONT,
-            0.5,
-            TEXT_COLOR,
-            2
-        )
-
-        # Draw center point
-        center_x = x + w // 2
-        center_y = y + h // 2
-        cv2.circle(frame, (center_x, center_y), 5, FACE_COLOR, -1)
-
-    return frame
-
-
-def get_largest_face(faces):
-    """
-    Get the largest face (by area) from detected faces.
-
-    Args:
-        faces: List of face rectangles
-
-    Returns:
-        tuple: (x, y, w, h) of largest face, or None if no faces
-    """
-    if len(faces) == 0:
-        return None
-
-    # Calculate areas and find largest
-    areas = [w * h for (x, y, w, h) in faces]
-    largest_idx = np.argmax(areas)
-
-    return faces[largest_idx]
-
-
-# ============================================================
-# ROBOT HEAD TRACKING
-# ============================================================
-
-def calculate_head_yaw_from_face(face_rect, frame_width):
-    """
-    Calculate robot head yaw based on face position in frame.
-
-    Args:
-        face_rect: (x, y, w, h) of face
-        frame_width: Width of camera frame
-
-    Returns:
-        float: Yaw angle in degrees (-30 to +30)
-    """
-    if face_rect is None:
-        return 0.0
-
-    x, y, w, h = face_rect
-
-    # Calculate face center
-    face_center_x = x + w // 2
-
-    # Calculate offset from frame center (in pixels)
-    frame_center_x = frame_width // 2
-    offset_x = face_center_x - frame_center_x
-
-    # Convert pixel offset to yaw angle
-    # Assume ±320 pixels (half width of 1280x720) maps to ±30 degrees
-    max_pixels = frame_width // 2
-    max_yaw = 30.0
-
-    yaw = (offset_x / max_pixels) * max_yaw
-
-    # Clamp to safe limits
-    yaw = max(-30.0, min(30.0, yaw))
-
-    return yaw
-
-
-def should_track_face(face_rect, frame_width):
-    """
-    Determine if robot should move head to track face.
-
-    Only track if face is significantly off-center.
-
-    Args:
-        face_rect: (x, y, w, h) of face
-        frame_width: Width of camera frame
-
-    Returns:
-        bool: True if should track
-    """
-    if face_rect is None:
-        return False
-
-    x, y, w, h = face_rect
-    face_center_x = x + w // 2
-    frame_center_x = frame_width // 2
-
-    offset = abs(face_center_x - frame_center_x)
-
-    return offset > TRACKING_THRESHOLD
+# Headless mode (REACHY_HEADLESS=1): skip all drawing and window ops -
+# useful for deployment and benchmarking where nobody is watching
+HEADLESS = bool(int(os.environ.get('REACHY_HEADLESS', '0')))
 
 
 # ============================================================
@@ -231,7 +81,7 @@ def run_face_detection(robot):
     print("🎭 Initializing face detector...")
 
     # Initialize face detector
-    face_cascade = init_face_detector()
+    face_detector = init_face_detector()
     print("✅ Face detector ready!")
 
     print("\n📷 Starting face detection...")
@@ -239,14 +89,30 @@ def run_face_detection(robot):
     print("   Press 'q' to quit\n")
 
     frame_count = 0
-    start_time = time.time()
+    start_time = time.perf_counter()
     current_yaw = 0.0
     last_track_time = 0
+    last_faces = []
+    quit_strip = None  # Pre-rendered static overlay, built on first frame
+    hud_text = None    # Cached HUD string, refreshed every HUD_REFRESH frames
+    gray_buf = None    # Persistent grayscale buffer for detect_faces
+
+    # Head motion goes through a single worker so the goto_target RPC
+    # never stalls the vision loop
+    motion_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    motion_future = None
+
+    # Rebind per-frame callables to locals - each cv2.* access is a
+    # module dict probe in CPython, and these run every iteration
+    _putText = cv2.putText
+    _imshow = cv2.imshow
+    _waitKey = cv2.waitKey
+    _get_frame = robot.media.get_frame
 
     try:
         while True:
             # Get frame from camera
-            frame = robot.media.get_frame()
+            frame = _get_frame()
 
             if frame is None:
                 print("⚠️  No frame received")
@@ -256,97 +122,105 @@ def run_face_detection(robot):
             frame_count += 1
             frame_height, frame_width = frame.shape[:2]
 
-            # Detect faces
-            faces = detect_faces(face_cascade, frame)
+            # Allocate the reusable grayscale buffer once frame size is known
+            if gray_buf is None:
+                gray_buf = cv2.UMat(frame_height, frame_width, cv2.CV_8UC1)
+
+            # Detect faces (skip N-1 of every N frames, reuse last result)
+            if (frame_count - 1) % DETECT_EVERY == 0:
+                faces = detect_faces(face_detector, frame, gray_buf)
+                last_faces = faces
+            else:
+                faces = last_faces
+
+            # One clock read per iteration, shared by FPS and tracking
+            now = time.perf_counter()
 
             # Calculate FPS
-            elapsed = time.time() - start_time
+            elapsed = now - start_time
             fps = frame_count / elapsed if elapsed > 0 else 0
 
-            # Draw face detections
-            frame = draw_face_detection(frame, faces)
-
-            # Add overlay info
-            cv2.putText(
-                frame,
-                f"Faces Detected: {len(faces)}",
-                (10, 30),
-                FONT,
-                0.7,
-                TEXT_COLOR,
-                2
-            )
-            cv2.putText(
-                frame,
-                f"FPS: {fps:.1f}",
-                (10, 60),
-                FONT,
-                0.6,
-                TEXT_COLOR,
-                2
-            )
-            cv2.putText(
-                frame,
-                f"Head Yaw: {current_yaw:+.1f}°",
-                (10, 90),
-                FONT,
-                0.6,
-                TEXT_COLOR,
-                2
-            )
-            cv2.putText(
-                frame,
-                "Press 'q' to quit",
-                (10, frame_height - 20),
-                FONT,
-                0.6,
-                TEXT_COLOR,
-                2
-            )
+            # Skip all drawing when nobody is watching
+            if not HEADLESS:
+                # Draw face detections
+                frame = draw_face_detection(frame, faces)
+
+                # Add overlay info - one dynamic HUD line, reformatted only
+                # every few frames (the values barely move in between)
+                if hud_text is None or (frame_count - 1) % HUD_REFRESH == 0:
+                    hud_text = f"Faces: {len(faces)} | FPS: {fps:.1f} | Yaw: {current_yaw:+.1f}"
+                _putText(frame, hud_text, (10, 30), FONT, 0.6, TEXT_COLOR, 2)
+
+                # The quit prompt never changes - rasterize it once into a
+                # small strip and blend that into the bottom of the frame
+                if quit_strip is None:
+                    quit_strip = np.zeros((30, frame_width, 3), np.uint8)
+                    _putText(
+                        quit_strip,
+                        "Press 'q' to quit",
+                        (10, 20),
+                        FONT,
+                        0.6,
+                        TEXT_COLOR,
+                        2
+                    )
+                frame[-30:] = cv2.addWeighted(frame[-30:], 0.5, quit_strip, 1.0, 0)
 
             # Track largest face with robot head
             if len(faces) > 0:
-                largest_face = get_largest_face(faces)
+                # One compiled pass: largest face, its yaw, and track flag
+                rects = np.ascontiguousarray(faces, dtype=np.int32)
+                _, target_yaw, track = analyze_faces(
+                    rects, frame_width, TRACKING_THRESHOLD, MAX_YAW
+                )
 
                 # Only track if face is significantly off-center
                 # and enough time has passed since last movement
-                if should_track_face(largest_face, frame_width):
-                    current_time = time.time()
-                    if current_time - last_track_time > TRACKING_SPEED:
-                        target_yaw = calculate_head_yaw_from_face(
-                            largest_face,
-                            frame_width
-                        )
-
-                        # Move head to look at face
+                if track:
+                    if now - last_track_time > TRACKING_SPEED:
+                        # Move head to look at face (fire-and-forget -
+                        # only submit if the previous motion finished)
                         head_pose = create_head_pose(
                             roll=0,
                             pitch=0,
                             yaw=target_yaw
                         )
 
-                        robot.goto_target(
-                            head=head_pose,
-                            duration=TRACKING_SPEED
-                        )
-
-                        current_yaw = target_yaw
-                        last_track_time = current_time
-
-                        print(f"👁️  Tracking face at yaw: {target_yaw:+.1f}°")
-
-            # Display frame
-            cv2.imshow("Reachy Mini - Face Detection", frame)
-
-            # Check for quit
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                print("\n👋 Quitting...")
-                break
+                        if motion_future is None or motion_future.done():
+                            motion_future = motion_executor.submit(
+                                robot.goto_target,
+                                head=head_pose,
+                                duration=TRACKING_SPEED
+                            )
+
+                            current_yaw = target_yaw
+                            last_track_time = now
+
+                            print(f"👁️  Tracking face at yaw: {target_yaw:+.1f}°")
+
+            if not HEADLESS:
+                # Display frame and check for quit
+                _imshow("Reachy Mini - Face Detection", frame)
+
+                if _waitKey(1) & 0xFF == ord('q'):
+                    print("\n👋 Quitting...")
+                    break
+            else:
+                # get_frame() hands back the latest frame immediately, so
+                # an ungated headless loop would busy-spin. Sleep only the
+                # remainder of the 30 FPS budget (measured from this
+                # iteration's clock read) instead of a fixed 10 ms.
+                sleep_left = HEADLESS_FRAME_DT - (time.perf_counter() - now)
+                if sleep_left > 0.001:
+                    time.sleep(sleep_left)
 
     except KeyboardInterrupt:
         print("\n\n👋 Interrupted by user")
 
     finally:
+        # Let any in-flight motion finish before moving to neutral
+        motion_executor.shutdown(wait=True)
+
         # Return head to neutral
         print("Returning head to neutral...")
         neutral_head = create_head_pose(0, 0, 0)
@@ -366,18 +240,28 @@ def run_face_detection(robot):
 # INITIALIZATION
 # ============================================================
 
-def init_robot():
-    """
-    Initialize robot connection with camera.
-
-    Returns:
-        ReachyMini: Connected robot instance
-    """
+def wait_for_operator():
+    """Prompt until the operator confirms the simulator is running."""
     print(BANNER)
     print("⚠️  Make sure simulator is running in another terminal!")
     print("   (Run: reachy-sim)\n")
+    # cv2.waitKey can cost 15+ ms per frame on some platforms - point
+    # at headless mode when there is no display to serve anyway
+    if not HEADLESS and os.environ.get('DISPLAY') is None:
+        print("💡 Tip: no display detected - set REACHY_HEADLESS=1 to skip")
+        print("   the GUI entirely (cv2.waitKey overhead disappears)\n")
+
     input("Press Enter when simulator is ready...")
 
+
+def connect_robot():
+    """
+    Connect to the simulator with camera - no prompts, so benchmark
+    harnesses can call this directly and skip wait_for_operator().
+
+    Returns:
+        ReachyMini: Connected robot instance
+    """
     print("\n🔌 Connecting to simulator...")
     robot = ReachyMini(
         localhost_only=True,
@@ -395,6 +279,21 @@ def init_robot():
     return robot
 
 
+def init_robot():
+    """
+    Initialize robot connection with camera (interactive).
+
+    Returns:
+        ReachyMini: Connected robot instance
+    """
+    # Load the detector while the operator reads the prompt -
+    # init_face_detector caches, so the run loop's call returns instantly
+    threading.Thread(target=init_face_detector, daemon=True).start()
+
+    wait_for_operator()
+    return connect_robot()
+
+
 # ============================================================
 # MAIN PROGRAM
 # ============================================================
@@ -24,10 +24,24 @@ from emoji_robot_clean import show_happy, show_sad, show_curious
 
 from reachy_mini import ReachyMini
 from reachy_mini.utils import create_head_pose
+import concurrent.futures
 import cv2
+import threading
 import time
 import numpy as np
 
+# Shared face pipeline - detector setup, detection, drawing, capture
+from _face_common import (
+    FONT,
+    TEXT_COLOR,
+    analyze_faces,
+    detect_faces,
+    draw_face_detection,
+    init_face_detector,
+    init_webcam,
+    start_capture_thread,
+)
+
 # ============================================================
 # CONSTANTS
 # ============================================================
@@ -38,129 +52,24 @@ REACHY MINI - FACE TRACKING WITH EMOTIONS
 ==================================================
 """
 
-# Face detection parameters
-SCALE_FACTOR = 1.1
-MIN_NEIGHBORS = 5
-MIN_SIZE = (50, 50)
+# Detection cadence - head motion is gated at ~2 Hz anyway, so running
+# the detector on every frame wastes cycles. Reuse the last result between.
+DETECT_EVERY = 3  # Run the detector on every Nth frame
+HUD_REFRESH = 5   # Rebuild the HUD string only every Nth frame
 
 # Robot tracking parameters
 TRACKING_THRESHOLD = 5
 TRACKING_SPEED = 0.5
+MAX_YAW = 30.0           # Head yaw clamp (degrees)
 
 # Emotion behavior parameters
 EMOTION_COOLDOWN = 5.0      # Seconds between emotions
 HAPPY_TRIGGER_TIME = 3.0    # Show happy after this many seconds
 GOODBYE_DELAY = 2.0          # Wait before showing sad when face disappears
 
-# Display parameters
-FACE_COLOR = (0, 255, 0)
-TEXT_COLOR = (0, 255, 0)
-FONT = cv2.FONT_HERSHEY_SIMPLEX
-
-
-# ============================================================
-# FACE DETECTION (Same as before)
-# ============================================================
-
-def init_face_detector():
-    """Initialize OpenCV face detector."""
-    face_cascade = cv2.CascadeClassifier(
-        cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-    )
-    if face_cascade.empty():
-        raise RuntimeError("Failed to load Haar Cascade face detector!")
-    return face_cascade
-
-
-def detect_faces(face_cascade, frame):
-    """Detect faces in a frame."""
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    faces = face_cascade.detectMultiScale(
-        gray,
-        scaleFactor=SCALE_FACTOR,
-        minNeighbors=MIN_NEIGHBORS,
-        minSize=MIN_SIZE
-    )
-    return faces
-
-
-def draw_face_detection(frame, faces, emotion_state):
-    """Draw rectangles around detected faces and show emotion state."""
-    for i, (x, y, w, h) in enumerate(faces):
-        cv2.rectangle(frame, (x, y), (x + w, y + h), FACE_COLOR, 2)
-        label = f"Face {i + 1}"
-        cv2.putText(frame, label, (x, y - 10), FONT, 0.5, TEXT_COLOR, 2)
-        center_x = x + w // 2
-        center_y = y + h // 2
-        cv2.circle(frame, (center_x, center_y), 5, FACE_COLOR, -1)
-
-    # Show current emotion state
-    emotion_text = f"Emotion: {emotion_state}"
-    cv2.putText(frame, emotion_text, (10, 150), FONT, 0.6, (255, 255, 0), 2)
-
-    return frame
-
-
-def get_largest_face(faces):
-    """Get the largest face by area."""
-    if len(faces) == 0:
-        return None
-    areas = [w * h for (x, y, w, h) in faces]
-    largest_idx = np.argmax(areas)
-    return faces[largest_idx]
-
-
-def calculate_head_yaw_from_face(face_rect, frame_width):
-    """Calculate robot head yaw based on face position."""
-    if face_rect is None:
-        return 0.0
-
-    x, y, w, h = face_rect
-    face_center_x = x + w // 2
-    frame_center_x = frame_width // 2
-    offset_x = face_center_x - frame_center_x
-
-    max_pixels = frame_width // 2
-    max_yaw = 30.0
-    yaw = (offset_x / max_pixels) * max_yaw
-    yaw = max(-30.0, min(30.0, yaw))
-
-    return yaw
-
-
-def should_track_face(face_rect, frame_width):
-    """Determine if robot should move head to track face."""
-    if face_rect is None:
-        return False
-
-    x, y, w, h = face_rect
-    face_center_x = x + w // 2
-    frame_center_x = frame_width // 2
-    offset = abs(face_center_x - frame_center_x)
-
-    return offset > TRACKING_THRESHOLD
-
-
-# ============================================================
-# WEBCAM CAPTURE
-# ============================================================
-
-def init_webcam():
-    """Initialize Mac webcam."""
-    print("📷 Opening Mac webcam...")
-    cap = cv2.VideoCapture(0)
-
-    if not cap.isOpened():
-        raise RuntimeError("Failed to open webcam!")
-
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-
-    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-    print(f"✅ Webcam opened: {width}x{height}")
-
-    return cap
+# Headless mode (REACHY_HEADLESS=1): skip all drawing and window ops -
+# useful for deployment and benchmarking where nobody is watching
+HEADLESS = bool(int(os.environ.get('REACHY_HEADLESS', '0')))
 
 
 # ============================================================
@@ -177,20 +86,28 @@ class EmotionStateMachine:
         self.was_face_detected = False
         self.face_first_seen_time = None
         self.face_last_seen_time = None
-        self.last_emotion_time = 0
+        # Negative so the first emotion is never cooldown-gated (the
+        # caller's clock is perf_counter, whose origin is arbitrary)
+        self.last_emotion_time = -EMOTION_COOLDOWN
         self.emotion_in_progress = False
 
-    def update(self, faces_detected):
+        # Emotion playback runs on a single worker thread - the show_*
+        # sequences sleep for 1-2 s, which would stall the vision loop
+        # if executed inline
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def update(self, faces_detected, now):
         """
         Update emotion state based on face detection.
 
         Args:
             faces_detected: Boolean, True if faces are detected
+            now: Current time from the loop's single perf_counter read
 
         Returns:
             str: Current emotion state
         """
-        current_time = time.time()
+        current_time = now
         self.was_face_detected = self.face_detected
         self.face_detected = faces_detected
 
@@ -205,7 +122,7 @@ class EmotionStateMachine:
         if self.face_detected and not self.was_face_detected:
             self.face_first_seen_time = current_time
             self.face_last_seen_time = current_time
-            self._trigger_emotion("CURIOUS")
+            self._trigger_emotion("CURIOUS", current_time)
             print("👀 New face detected! Showing CURIOUS emotion...")
             return self.state
 
@@ -217,7 +134,7 @@ class EmotionStateMachine:
             time_since_first_seen = current_time - self.face_first_seen_time
             if (time_since_first_seen >= HAPPY_TRIGGER_TIME and
                 self.state != "HAPPY"):
-                self._trigger_emotion("HAPPY")
+                self._trigger_emotion("HAPPY", current_time)
                 print("😊 Person staying! Showing HAPPY emotion...")
                 return self.state
 
@@ -226,38 +143,45 @@ class EmotionStateMachine:
             if self.face_last_seen_time:
                 time_since_last_seen = current_time - self.face_last_seen_time
                 if time_since_last_seen >= GOODBYE_DELAY:
-                    self._trigger_emotion("SAD")
+                    self._trigger_emotion("SAD", current_time)
                     print("👋 Person left! Showing SAD emotion...")
                     self.face_first_seen_time = None
                     return self.state
 
         return self.state
 
-    def _trigger_emotion(self, emotion):
+    def _trigger_emotion(self, emotion, now):
         """Trigger an emotion (will be executed in main loop)."""
         self.state = emotion
-        self.last_emotion_time = time.time()
+        self.last_emotion_time = now
 
     def execute_emotion(self):
-        """Execute the current emotion if needed."""
+        """Kick off the current emotion on the worker thread (non-blocking)."""
         if self.state == "NEUTRAL" or self.emotion_in_progress:
             return
 
         self.emotion_in_progress = True
+        future = self._executor.submit(self._run_emotion, self.state)
+        # Clear the in-progress flag from the worker side once playback ends
+        future.add_done_callback(
+            lambda f: setattr(self, 'emotion_in_progress', False)
+        )
 
-        try:
-            if self.state == "CURIOUS":
-                show_curious(self.robot)
-            elif self.state == "HAPPY":
-                show_happy(self.robot)
-            elif self.state == "SAD":
-                show_sad(self.robot)
+    def _run_emotion(self, emotion):
+        """Worker-side emotion sequence - runs off the vision loop."""
+        if emotion == "CURIOUS":
+            show_curious(self.robot)
+        elif emotion == "HAPPY":
+            show_happy(self.robot)
+        elif emotion == "SAD":
+            show_sad(self.robot)
 
-            # Return to neutral state after emotion
-            self.state = "NEUTRAL"
+        # Return to neutral state after emotion
+        self.state = "NEUTRAL"
 
-        finally:
-            self.emotion_in_progress = False
+    def shutdown(self):
+        """Wait for any in-flight emotion to finish."""
+        self._executor.shutdown(wait=True)
 
 
 # ============================================================
@@ -267,7 +191,7 @@ class EmotionStateMachine:
 def run_face_tracking_with_emotions(robot, webcam):
     """Main demo loop with emotions."""
     print("\n🎭 Initializing face detector...")
-    face_cascade = init_face_detector()
+    face_detector = init_face_detector()
     print("✅ Face detector ready!")
 
     print("\n📷 Starting face tracking with emotions...")
@@ -277,76 +201,112 @@ def run_face_tracking_with_emotions(robot, webcam):
     # Initialize emotion state machine
     emotion_machine = EmotionStateMachine(robot)
 
+    # Capture runs on its own thread; we always consume the newest frame
+    frame_queue = start_capture_thread(webcam)
+
     frame_count = 0
-    start_time = time.time()
+    start_time = time.perf_counter()
     current_yaw = 0.0
     last_track_time = 0
+    last_faces = []
+    quit_strip = None  # Pre-rendered static overlay, built on first frame
+    hud_text = None    # Cached HUD string, refreshed every HUD_REFRESH frames
+    gray_buf = None    # Persistent grayscale buffer for detect_faces
+
+    # Rebind per-frame callables to locals - each cv2.* access is a
+    # module dict probe in CPython, and these run every iteration
+    _putText = cv2.putText
+    _imshow = cv2.imshow
+    _waitKey = cv2.waitKey
+    _get_frame = frame_queue.get
 
     try:
         while True:
-            # Get frame from webcam
-            ret, frame = webcam.read()
-
-            if not ret:
-                print("⚠️  Failed to read from webcam")
-                time.sleep(0.1)
-                continue
+            # Get latest frame from the capture thread
+            frame = _get_frame()
 
             frame_count += 1
             frame_height, frame_width = frame.shape[:2]
 
-            # Detect faces
-            faces = detect_faces(face_cascade, frame)
+            # Allocate the reusable grayscale buffer once frame size is known
+            if gray_buf is None:
+                gray_buf = cv2.UMat(frame_height, frame_width, cv2.CV_8UC1)
+
+            # Detect faces (skip N-1 of every N frames, reuse last result)
+            if (frame_count - 1) % DETECT_EVERY == 0:
+                faces = detect_faces(face_detector, frame, gray_buf)
+                last_faces = faces
+            else:
+                faces = last_faces
             faces_detected = len(faces) > 0
 
+            # One clock read per iteration, shared by the emotion state
+            # machine, FPS, and tracking
+            now = time.perf_counter()
+
             # Update emotion state
-            emotion_state = emotion_machine.update(faces_detected)
+            emotion_state = emotion_machine.update(faces_detected, now)
 
             # Execute emotion if triggered (non-blocking check)
             if not emotion_machine.emotion_in_progress:
                 emotion_machine.execute_emotion()
 
             # Calculate FPS
-            elapsed = time.time() - start_time
+            elapsed = now - start_time
             fps = frame_count / elapsed if elapsed > 0 else 0
 
-            # Draw face detections
-            frame = draw_face_detection(frame, faces, emotion_state)
+            # Skip all drawing when nobody is watching
+            if not HEADLESS:
+                # Draw face detections
+                frame = draw_face_detection(frame, faces, emotion_state)
+
+                # Add overlay info
+                # HUD string is only reformatted every few frames
+                if hud_text is None or (frame_count - 1) % HUD_REFRESH == 0:
+                    hud_text = (f"Faces: {len(faces)} | FPS: {fps:.1f} | "
+                                f"Yaw: {current_yaw:+.1f} | {emotion_state}")
+                _putText(frame, hud_text, (10, 30), FONT, 0.6, TEXT_COLOR, 2)
 
-            # Add overlay info
-            cv2.putText(frame, f"Faces: {len(faces)}", (10, 30), FONT, 0.7, TEXT_COLOR, 2)
-            cv2.putText(frame, f"FPS: {fps:.1f}", (10, 60), FONT, 0.6, TEXT_COLOR, 2)
-            cv2.putText(frame, f"Robot Yaw: {current_yaw:+.1f}°", (10, 90), FONT, 0.6, TEXT_COLOR, 2)
-            cv2.putText(frame, "State: " + emotion_state, (10, 120), FONT, 0.6, (255, 255, 0), 2)
-            cv2.putText(frame, "Press 'q' to quit", (10, frame_height - 20), FONT, 0.6, TEXT_COLOR, 2)
+                # Static quit prompt is rasterized once and blended each frame
+                if quit_strip is None:
+                    quit_strip = np.zeros((30, frame_width, 3), np.uint8)
+                    _putText(quit_strip, "Press 'q' to quit", (10, 20), FONT, 0.6, TEXT_COLOR, 2)
+                frame[-30:] = cv2.addWeighted(frame[-30:], 0.5, quit_strip, 1.0, 0)
 
             # Track largest face (only when not showing emotion)
             if faces_detected and not emotion_machine.emotion_in_progress:
-                largest_face = get_largest_face(faces)
-                target_yaw = calculate_head_yaw_from_face(largest_face, frame_width)
-
-                if should_track_face(largest_face, frame_width):
-                    current_time = time.time()
-                    if current_time - last_track_time > TRACKING_SPEED:
+                # One compiled pass: largest face, its yaw, and track flag
+                rects = np.ascontiguousarray(faces, dtype=np.int32)
+                _, target_yaw, track = analyze_faces(
+                    rects, frame_width, TRACKING_THRESHOLD, MAX_YAW
+                )
+
+                if track:
+                    if now - last_track_time > TRACKING_SPEED:
                         head_pose = create_head_pose(roll=0, pitch=0, yaw=target_yaw)
                         robot.goto_target(head=head_pose, duration=TRACKING_SPEED)
                         current_yaw = target_yaw
-                        last_track_time = current_time
+                        last_track_time = now
                 else:
                     current_yaw = target_yaw
 
-            # Display webcam feed
-            cv2.imshow("Face Tracking with Emotions", frame)
+            if not HEADLESS:
+                # Display frame and check for quit
+                _imshow("Face Tracking with Emotions", frame)
 
-            # Check for quit
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                print("\n👋 Quitting...")
-                break
+                if _waitKey(1) & 0xFF == ord('q'):
+                    print("\n👋 Quitting...")
+                    break
+            # No headless sleep needed - frame_queue.get() at the top of
+            # the loop already blocks until the capture thread publishes
 
     except KeyboardInterrupt:
         print("\n\n👋 Interrupted by user")
 
     finally:
+        # Let any in-flight emotion finish before moving to neutral
+        emotion_machine.shutdown()
+
         # Return robot to neutral
         print("Returning to neutral...")
         neutral_head = create_head_pose(0, 0, 0)
@@ -367,13 +327,22 @@ def run_face_tracking_with_emotions(robot, webcam):
 # INITIALIZATION
 # ============================================================
 
-def init_robot():
-    """Initialize robot connection."""
+def wait_for_operator():
+    """Prompt until the operator confirms the simulator is running."""
     print(BANNER)
     print("⚠️  Make sure simulator is running!")
     print("   (Run: reachy-sim)\n")
+    # cv2.waitKey can cost 15+ ms per frame on some platforms - point
+    # at headless mode when there is no display to serve anyway
+    if not HEADLESS and os.environ.get('DISPLAY') is None:
+        print("💡 Tip: no display detected - set REACHY_HEADLESS=1 to skip")
+        print("   the GUI entirely (cv2.waitKey overhead disappears)\n")
+
     input("Press Enter when simulator is ready...")
 
+
+def connect_robot():
+    """Connect to the simulator - no prompts, benchmark friendly."""
     print("\n🔌 Connecting to simulator...")
     robot = ReachyMini(
         localhost_only=True,
@@ -384,6 +353,16 @@ def init_robot():
     return robot
 
 
+def init_robot():
+    """Initialize robot connection (interactive)."""
+    # Load the detector while the operator reads the prompt -
+    # init_face_detector caches, so the run loop's call returns instantly
+    threading.Thread(target=init_face_detector, daemon=True).start()
+
+    wait_for_operator()
+    return connect_robot()
+
+
 # ============================================================
 # MAIN PROGRAM
 # ============================================================
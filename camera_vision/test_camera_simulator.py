@@ -14,9 +14,23 @@ Expected result: Camera window showing simulator view with FPS counter.
 """
 
 from reachy_mini import ReachyMini
+import argparse
 import cv2
+import numpy as np
 import time
 
+parser = argparse.ArgumentParser(description="Simulator camera test")
+parser.add_argument(
+    '--headless',
+    action='store_true',
+    help="No preview window - just measure capture throughput"
+)
+args = parser.parse_args()
+
+# This script only displays frames - a single OpenCV worker thread is
+# plenty and avoids thread-pool stalls inside imshow
+cv2.setNumThreads(1)
+
 print("=" * 60)
 print("CAMERA TEST - Simulator with OpenCV Backend")
 print("=" * 60)
@@ -46,66 +60,152 @@ try:
     print(f"   Stream: UDP from simulator (127.0.0.1:5005)")
     print(f"   Resolution: {robot.media.camera._resolution}")
 
+    # The SDK's VideoCapture keeps OpenCV's default multi-frame buffer,
+    # so get_frame() serves queued (stale) frames whenever display falls
+    # behind the 60 fps stream. A 1-frame buffer keeps latency at one
+    # frame instead of buffer-depth frames.
+    cap = getattr(robot.media.camera, "_cap", None)
+    if cap is not None:
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        print("   Capture buffer: 1 frame (freshest-frame mode)")
+
     print("\n📷 Capturing frames from simulator camera...")
-    print("   Press 'q' to quit\n")
+    if args.headless:
+        print("   Headless mode - press Ctrl+C to stop\n")
+    else:
+        print("   Press 'q' to quit\n")
+
+    # The simulator streams 60 fps but the annotated window can't keep
+    # up - decode only the frames we will actually display
+    DISPLAY_FPS = 30
+    DISPLAY_INTERVAL = 1.0 / DISPLAY_FPS
 
     frame_count = 0
     start_time = time.time()
+    last_display = 0.0
+    static_overlay = None  # Constant HUD text, rasterized on first frame
+    static_mask = None
+    hud_text = None        # Cached dynamic FPS line
+
+    # Rebind per-frame callables to locals - each cv2.*/time.* access is
+    # a module dict probe in CPython, and these run up to 60x/s
+    _time = time.time
+    _imshow = cv2.imshow
+    _putText = cv2.putText
+    _copyto = np.copyto
+    _waitKey = cv2.waitKey
+    _pollKey = getattr(cv2, 'pollKey', None)
+    _get_frame = robot.media.get_frame
+    _grab = cap.grab if cap is not None else None
+    _retrieve = cap.retrieve if cap is not None else None
+    FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+    headless = args.headless
 
     while True:
-        # Get frame from camera using SDK method
-        frame = robot.media.get_frame()
+        if _grab is not None:
+            # grab() advances the stream without paying the decode cost;
+            # retrieve() (the expensive JPEG/H.264 decode) runs only when
+            # a display slot is due, so skipped frames cost almost nothing
+            if not _grab():
+                frame = None
+            elif headless:
+                # Headless skips rasterization and presentation entirely -
+                # count the grab, and decode one frame in 60 as a
+                # liveness check on the stream contents
+                frame_count += 1
+                if frame_count % 60 == 0 and not _retrieve()[0]:
+                    print("⚠️  retrieve() failed (is simulator running?)")
+                continue
+            elif _time() - last_display < DISPLAY_INTERVAL:
+                continue
+            else:
+                ok, frame = _retrieve()
+                if not ok:
+                    frame = None
+                last_display = _time()
+        else:
+            # SDK internals not reachable - fall back to the decoded path
+            frame = _get_frame()
+            if headless:
+                if frame is None:
+                    print("⚠️  No frame received (is simulator running?)")
+                    time.sleep(0.1)
+                else:
+                    frame_count += 1
+                continue
 
         if frame is not None:
             frame_count += 1
 
             # Calculate FPS
-            elapsed = time.time() - start_time
+            elapsed = _time() - start_time
             fps = frame_count / elapsed if elapsed > 0 else 0
 
-            # Add info overlay to frame
-            cv2.putText(
+            # The title, resolution and quit prompt never change -
+            # rasterize them once (putText's per-glyph antialiased
+            # rendering is expensive at 1280x720) and blit each frame
+            # with one masked copy
+            if static_overlay is None:
+                static_overlay = np.zeros_like(frame)
+                _putText(
+                    static_overlay,
+                    "Reachy Mini Simulator - OpenCV Backend",
+                    (10, 30),
+                    FONT,
+                    0.7,
+                    (0, 255, 0),
+                    2
+                )
+                _putText(
+                    static_overlay,
+                    f"Resolution: {frame.shape[1]}x{frame.shape[0]}",
+                    (10, 90),
+                    FONT,
+                    0.6,
+                    (0, 255, 0),
+                    2
+                )
+                _putText(
+                    static_overlay,
+                    "Press 'q' to quit",
+                    (10, frame.shape[0] - 20),
+                    FONT,
+                    0.6,
+                    (0, 255, 0),
+                    2
+                )
+                static_mask = static_overlay.any(axis=2, keepdims=True)
+            _copyto(frame, static_overlay, where=static_mask)
+
+            # Only the FPS line is dynamic, and it barely moves between
+            # frames - reformat it every 6th frame and redraw the cache
+            if hud_text is None or frame_count % 6 == 0:
+                hud_text = f"FPS: {fps:.1f} | Frames: {frame_count}"
+            _putText(
                 frame,
-                "Reachy Mini Simulator - OpenCV Backend",
-                (10, 30),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.7,
-                (0, 255, 0),
-                2
-            )
-            cv2.putText(
-                frame,
-                f"FPS: {fps:.1f} | Frames: {frame_count}",
+                hud_text,
                 (10, 60),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.6,
-                (0, 255, 0),
-                2
-            )
-            cv2.putText(
-                frame,
-                f"Resolution: {frame.shape[1]}x{frame.shape[0]}",
-                (10, 90),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.6,
-                (0, 255, 0),
-                2
-            )
-            cv2.putText(
-                frame,
-                "Press 'q' to quit",
-                (10, frame.shape[0] - 20),
-                cv2.FONT_HERSHEY_SIMPLEX,
+                FONT,
                 0.6,
                 (0, 255, 0),
                 2
             )
 
             # Display frame
-            cv2.imshow("Reachy Mini Simulator Camera", frame)
-
-            # Check for quit
-            if cv2.waitKey(1) & 0xFF == ord('q'):
+            _imshow("Reachy Mini Simulator Camera", frame)
+
+            # Check for quit - waitKey(1) can cost 15+ ms per call pumping
+            # the GUI timeout path. pollKey (OpenCV 4.5+) processes window
+            # events and returns immediately; without it, fall back to
+            # polling waitKey only every 4th frame.
+            if _pollKey is not None:
+                key = _pollKey()
+            elif frame_count % 4 == 0:
+                key = _waitKey(1)
+            else:
+                key = -1
+            if key & 0xFF == ord('q'):
                 print("\n👋 Quitting...")
                 break
         else:
@@ -115,6 +215,11 @@ try:
     # Cleanup
     cv2.destroyAllWindows()
 
+    # Recompute here so headless runs (which never enter the display
+    # branch) report accurate numbers too
+    elapsed = time.time() - start_time
+    fps = frame_count / elapsed if elapsed > 0 else 0
+
     print(f"\n📊 Statistics:")
     print(f"   Total frames: {frame_count}")
     print(f"   Average FPS: {fps:.1f}")
@@ -126,6 +231,15 @@ try:
 
 except KeyboardInterrupt:
     print("\n\n👋 Interrupted by user")
+    # Headless runs end via Ctrl+C - still report the throughput numbers
+    # (guarded: the interrupt may land before capture ever started)
+    if 'start_time' in globals():
+        elapsed = time.time() - start_time
+        fps = frame_count / elapsed if elapsed > 0 else 0
+        print(f"\n📊 Statistics:")
+        print(f"   Total frames: {frame_count}")
+        print(f"   Average FPS: {fps:.1f}")
+        print(f"   Duration: {elapsed:.1f}s")
 
 except Exception as e:
     print(f"\n❌ Error: {e}")
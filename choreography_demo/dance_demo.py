@@ -14,9 +14,21 @@ os.environ['GI_TYPELIB_PATH'] = '/opt/homebrew/lib/girepository-1.0'
 
 from reachy_mini import ReachyMini
 from reachy_mini.motion.recorded_move import RecordedMoves
+from concurrent.futures import ThreadPoolExecutor
 import json
 import time
-import threading
+
+# Load the 8-bit track once at import - decoding the WAV header and
+# allocating the full sample buffer on every playback only delays the
+# audio start
+try:
+    import sounddevice as sd
+    from scipy.io import wavfile
+    _sample_rate, _audio_data = wavfile.read("another_one_8bit.wav")
+except Exception as e:
+    sd = None
+    _audio_data = None
+    print(f"⚠️  Could not preload music: {e}")
 
 print("🎵 Loading choreography: Another One Bites The Dust by Queen!")
 print()
@@ -46,9 +58,26 @@ dance_moves = RecordedMoves("pollen-robotics/reachy-mini-dances-library")
 print(f"Available dance moves: {dance_moves.list_moves()}")
 print()
 
+# The library fetches moves lazily from Hugging Face on first .get(),
+# which would stall the opening step while the music is already playing.
+# Prefetch every move this choreography uses, in parallel, before the
+# show starts.
+move_names = {step['move'] for step in choreography['sequence']}
+print(f"Prefetching {len(move_names)} moves used by the choreography...")
+with ThreadPoolExecutor(max_workers=8) as executor:
+    moves = dict(zip(move_names, executor.map(dance_moves.get, move_names)))
+print("✅ All moves ready!")
+print()
+
 # Function to play music
 def play_music():
-    """Play the 8-bit music file through robot or Mac speakers"""
+    """Start the 8-bit music through robot or Mac speakers (non-blocking).
+
+    Playback runs on PortAudio's own C callback thread (or the robot's
+    media pipeline), so the motion loop below never shares the GIL with
+    audio delivery - a Python playback thread would preempt the motor
+    command timing and risk audio underruns.
+    """
     if has_audio:
         # Play through robot's speakers!
         try:
@@ -57,25 +86,22 @@ def play_music():
         except Exception as e:
             print(f"⚠️  Could not play through robot: {e}")
     else:
-        # Fallback to Mac speakers
-        try:
-            import sounddevice as sd
-            from scipy.io import wavfile
+        # Fallback to Mac speakers - samples were preloaded at import
+        if _audio_data is None:
+            print("⚠️  Music not available (preload failed)")
+        else:
             print("🔊 Playing 8-bit music from your Mac...")
-            sample_rate, audio_data = wavfile.read("another_one_8bit.wav")
-            sd.play(audio_data, sample_rate)
-            sd.wait()
-        except Exception as e:
-            print(f"⚠️  Could not play music: {e}")
+            # No sd.wait() - the dance sequence is the foreground work
+            sd.play(_audio_data, _sample_rate)
 
 # Play the choreography!
 print("🎸 Starting the show! Press Ctrl+C to stop")
 print()
 
 try:
-    # Start the music in a separate thread so dance can start immediately
-    music_thread = threading.Thread(target=play_music)
-    music_thread.start()
+    # Start the music - play_music returns as soon as playback is handed
+    # to the audio backend, so the dance can start immediately
+    play_music()
 
     time.sleep(0.5)  # Small delay to let music start
     for step in choreography['sequence']:
@@ -84,8 +110,8 @@ try:
 
         print(f"▶️  Playing: {move_name} ({cycles} cycles)")
 
-        # Get the move from the library
-        move = dance_moves.get(move_name)
+        # Moves were prefetched before the music started
+        move = moves[move_name]
 
         # Play it the specified number of times
         for i in range(cycles):
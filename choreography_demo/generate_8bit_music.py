@@ -7,21 +7,114 @@ Creates a retro chiptune version of the iconic bassline!
 import numpy as np
 from scipy.io import wavfile
 
+# Optional numba JIT - with it the whole song renders in one native
+# scalar loop; without it we keep the vectorized per-segment NumPy path
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
 # Audio settings
 SAMPLE_RATE = 44100  # Standard audio sample rate
+VOLUME = 0.3  # Output level (fraction of full scale)
+
+# The WAV target is int16 at a fixed volume, so synthesize in int16
+# directly: 2 bytes per sample of memory traffic instead of 8, and no
+# clip/float-to-int pass at the end
+HI = np.int16(VOLUME * 32767)  # Square wave high level
+LO = np.int16(-HI)             # Square wave low level
 BPM = 114  # From the choreography file
 BEAT_DURATION = 60 / BPM  # Duration of one beat in seconds
 
-def generate_square_wave(frequency, duration, volume=0.3):
+# Musical notes (frequencies in Hz) - using lower octave for bass
+E2 = 82.41   # Low E (main note)
+A2 = 110.00  # A
+G2 = 98.00   # G
+
+# One bar of the iconic riff as (frequency, beat fraction) pairs,
+# with None marking a rest:
+# "dum dum dum" - three quick hits, then
+# "dum dum dum dum" - four more hits
+RIFF_PATTERN = [
+    (E2, 0.4), (None, 0.1),
+    (E2, 0.4), (None, 0.1),
+    (E2, 0.4), (None, 0.6),
+    (E2, 0.4), (None, 0.1),
+    (G2, 0.4), (None, 0.1),
+    (A2, 0.4), (None, 0.1),
+    (E2, 0.4), (None, 0.6),
+]
+
+# Repeat the pattern 8 times (matches roughly 32 beats for the dance)
+RIFF_REPEATS = 8
+
+def _square_samples(frequency, n):
+    """Render n samples of a square wave directly as int16."""
+    # 32.32 fixed-point phase accumulator: the integer part flips parity
+    # every half period (2x the frequency because a square wave flips
+    # twice per period). All-integer, and exact to 1/2^32 of a sample
+    # step, unlike truncating the frequency itself.
+    step = int(2 * frequency / SAMPLE_RATE * (1 << 32))
+    phase = (np.arange(n, dtype=np.int64) * step) >> 32
+    return np.where(phase & 1, HI, LO)
+
+def generate_square_wave(frequency, duration):
     """Generate a square wave (classic 8-bit sound)"""
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration), False)
-    # Square wave is created by taking the sign of a sine wave
-    wave = volume * np.sign(np.sin(2 * np.pi * frequency * t))
-    return wave
+    # Closed-form square wave: a phase accumulator whose integer part
+    # flips parity every half period. No transcendental, no float
+    # pipeline, no clip pass - samples come out at the target level.
+    return _square_samples(frequency, int(SAMPLE_RATE * duration))
 
 def generate_silence(duration):
     """Generate silence"""
-    return np.zeros(int(SAMPLE_RATE * duration))
+    # int16 so concatenating with the square waves never upcasts
+    return np.zeros(int(SAMPLE_RATE * duration), dtype=np.int16)
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def render_song(freqs, lengths, hi, lo):
+        """Render all segments into one int16 buffer in one native loop.
+
+        freqs uses 0.0 to mark a rest; lengths holds the sample count of
+        each segment. Compiled by numba, so the scalar phase accumulator
+        runs with no per-array NumPy overhead or temporaries.
+        """
+        total = 0
+        for n in lengths:
+            total += n
+        out = np.empty(total, dtype=np.int16)
+
+        offset = 0
+        for i in range(len(freqs)):
+            n = lengths[i]
+            frequency = freqs[i]
+            if frequency == 0.0:
+                for j in range(n):
+                    out[offset + j] = 0
+            else:
+                step = int(2.0 * frequency / SAMPLE_RATE * (1 << 32))
+                phase = 0
+                for j in range(n):
+                    out[offset + j] = hi if ((phase >> 32) & 1) else lo
+                    phase += step
+            offset += n
+        return out
+else:
+    def render_song(freqs, lengths, hi, lo):
+        """Vectorized fallback - one NumPy slice write per segment."""
+        out = np.empty(int(np.sum(lengths)), dtype=np.int16)
+
+        offset = 0
+        for i in range(len(freqs)):
+            n = int(lengths[i])
+            frequency = freqs[i]
+            if frequency == 0.0:
+                out[offset:offset + n] = 0
+            else:
+                out[offset:offset + n] = _square_samples(frequency, n)
+            offset += n
+        return out
 
 def create_another_one_bites_the_dust():
     """
@@ -32,42 +125,25 @@ def create_another_one_bites_the_dust():
     """
     print("🎵 Generating 8-bit version of 'Another One Bites The Dust'...")
 
-    # Musical notes (frequencies in Hz) - using lower octave for bass
-    E2 = 82.41   # Low E (main note)
-    A2 = 110.00  # A
-    G2 = 98.00   # G
-
-    # The iconic rhythm pattern (approximately 8 beats)
-    song = np.array([])
-
-    # Repeat the pattern 8 times (matches roughly 32 beats for the dance)
-    for _ in range(8):
-        # "dum dum dum" - three quick hits
-        song = np.concatenate([song, generate_square_wave(E2, BEAT_DURATION * 0.4)])
-        song = np.concatenate([song, generate_silence(BEAT_DURATION * 0.1)])
-        song = np.concatenate([song, generate_square_wave(E2, BEAT_DURATION * 0.4)])
-        song = np.concatenate([song, generate_silence(BEAT_DURATION * 0.1)])
-        song = np.concatenate([song, generate_square_wave(E2, BEAT_DURATION * 0.4)])
-        song = np.concatenate([song, generate_silence(BEAT_DURATION * 0.6)])
-
-        # "dum dum dum dum" - four more hits
-        song = np.concatenate([song, generate_square_wave(E2, BEAT_DURATION * 0.4)])
-        song = np.concatenate([song, generate_silence(BEAT_DURATION * 0.1)])
-        song = np.concatenate([song, generate_square_wave(G2, BEAT_DURATION * 0.4)])
-        song = np.concatenate([song, generate_silence(BEAT_DURATION * 0.1)])
-        song = np.concatenate([song, generate_square_wave(A2, BEAT_DURATION * 0.4)])
-        song = np.concatenate([song, generate_silence(BEAT_DURATION * 0.1)])
-        song = np.concatenate([song, generate_square_wave(E2, BEAT_DURATION * 0.4)])
-        song = np.concatenate([song, generate_silence(BEAT_DURATION * 0.6)])
-
-    # Normalize to prevent clipping
-    song = np.clip(song, -1, 1)
-
-    # Convert to 16-bit integer format
-    audio_data = np.int16(song * 32767)
+    # The pattern is fully deterministic, so it flattens to two arrays
+    # (frequency per segment, 0.0 for rests, and sample count per
+    # segment) that the render kernel walks in one pass over a single
+    # preallocated buffer
+    pattern = RIFF_PATTERN * RIFF_REPEATS
+    freqs = np.array(
+        [frequency if frequency is not None else 0.0 for frequency, _ in pattern]
+    )
+    lengths = np.array(
+        [int(SAMPLE_RATE * BEAT_DURATION * fraction) for _, fraction in pattern],
+        dtype=np.int64,
+    )
+    song = render_song(freqs, lengths, HI, LO)
+
+    # Samples are already int16 at the target level - no clip or
+    # float-to-int conversion pass needed
 
     # Save as WAV file
-    wavfile.write("another_one_8bit.wav", SAMPLE_RATE, audio_data)
+    wavfile.write("another_one_8bit.wav", SAMPLE_RATE, song)
     print("✅ 8-bit music generated: another_one_8bit.wav")
     print(f"   Duration: {len(song) / SAMPLE_RATE:.1f} seconds")
     print(f"   BPM: {BPM}")
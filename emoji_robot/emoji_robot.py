@@ -11,18 +11,81 @@ This program lets you control your robot's emotions using keyboard keys:
 
 from reachy_mini import ReachyMini
 from reachy_mini.utils import create_head_pose
+import numpy as np
+import concurrent.futures
+import select
+import sys
+import termios
 import time
-import os
+import tty
+
+# Head poses never change between triggers - build each one at module
+# load so the emotion loops only issue goto_target calls (pitch/roll/yaw
+# are in DEGREES!)
+HEAD_HAPPY = create_head_pose(roll=0, pitch=15, yaw=0)    # Looking up
+HEAD_SAD = create_head_pose(roll=0, pitch=-20, yaw=0)     # Looking down
+HEAD_UP = create_head_pose(roll=0, pitch=10, yaw=0)       # Nod up
+HEAD_DOWN = create_head_pose(roll=0, pitch=-10, yaw=0)    # Nod down
+HEAD_RIGHT = create_head_pose(roll=20, pitch=5, yaw=0)    # Tilt right
+HEAD_LEFT = create_head_pose(roll=-20, pitch=5, yaw=0)    # Tilt left
+HEAD_NEUTRAL = create_head_pose(0, 0, 0)
+
+# Antenna targets as arrays allocated once - the player hands them
+# straight to goto_target instead of building a fresh list per step
+ANT_HAPPY = np.array([0.8, 0.8], dtype=np.float32)
+ANT_SAD = np.array([-0.8, -0.8], dtype=np.float32)
+ANT_WIGGLE = np.array([1.0, -1.0], dtype=np.float32)
+ANT_WIGGLE_SWAP = np.array([-1.0, 1.0], dtype=np.float32)
+ANT_CURIOUS = np.array([0.6, -0.3], dtype=np.float32)
+ANT_CURIOUS_SWAP = np.array([-0.3, 0.6], dtype=np.float32)
+ANT_NEUTRAL = np.array([0.0, 0.0], dtype=np.float32)
+
+# Multi-step emotions as keyframe tables: (head pose, antennas, duration).
+# Built once at module load; the player streams them as one trajectory.
+# Excited = fast nodding + antenna wiggling, 3 times, then neutral
+EXCITED_KEYFRAMES = (
+    (HEAD_UP, ANT_WIGGLE, 0.2),         # Nod up, antennas opposite
+    (HEAD_DOWN, ANT_WIGGLE_SWAP, 0.2),  # Nod down, swap antennas
+) * 3 + (
+    (HEAD_NEUTRAL, ANT_NEUTRAL, 0.3),   # Return to neutral
+)
+
+# Curious = head tilting side to side (like a confused puppy!)
+CURIOUS_KEYFRAMES = (
+    (HEAD_RIGHT, ANT_CURIOUS, 0.6),       # Tilt right, one antenna up
+    (HEAD_LEFT, ANT_CURIOUS_SWAP, 0.6),   # Tilt left, swap antennas
+    (HEAD_RIGHT, ANT_CURIOUS, 0.6),       # Tilt right again
+    (HEAD_NEUTRAL, ANT_NEUTRAL, 0.5),     # Return to neutral
+)
+
+# Static banners are emitted as one write each - a print() per line
+# means a stdout lock + write() syscall per line, noticeable on slow
+# terminals (tmux over SSH)
+INTRO = "=" * 50 + """
+REACHY MINI - EMOJI ROBOT
+""" + "=" * 50 + """
+
+Choose mode:
+  1 - Real Robot (wireless)
+  2 - Simulation (no robot needed)
+
+"""
+
+EMOTION_MENU = """
+Robot is ready to show emotions!
+
+Press a key to show emotion:
+  h - Happy
+  s - Sad
+  e - Excited
+  c - Curious
+  q - Quit
+
+"""
 
 # Choose between simulation or real robot
-print("=" * 50)
-print("REACHY MINI - EMOJI ROBOT")
-print("=" * 50)
-print()
-print("Choose mode:")
-print("  1 - Real Robot (wireless)")
-print("  2 - Simulation (no robot needed)")
-print()
+sys.stdout.write(INTRO)
+sys.stdout.flush()
 
 while True:
     mode = input("Enter 1 or 2: ").strip()
@@ -42,16 +105,8 @@ while True:
     else:
         print("❌ Invalid choice! Enter 1 or 2")
 
-print()
-print("Robot is ready to show emotions!")
-print()
-print("Press a key to show emotion:")
-print("  h - Happy")
-print("  s - Sad")
-print("  e - Excited")
-print("  c - Curious")
-print("  q - Quit")
-print()
+sys.stdout.write(EMOTION_MENU)
+sys.stdout.flush()
 
 # Emotion Functions
 # Each function makes the robot express a different emotion
@@ -61,158 +116,140 @@ def show_happy():
     print("😊 Showing HAPPY emotion!")
 
     # Happy = looking up optimistically!
-    # Pitch up (positive = looking up)
-    head_pose = create_head_pose(
-        roll=0,     # No side tilt
-        pitch=15,   # Look up 15 degrees (in DEGREES!)
-        yaw=0       # Looking straight ahead
-    )
-
-    # Move head and antennas together
-    mini.goto_target(
-        head=head_pose,      # Head looking up
-        antennas=[0.8, 0.8], # Both antennas up high
-        duration=0.5
-    )
-    time.sleep(0.5)
+    # Move head and antennas together (both antennas up high)
+    goto_and_wait(HEAD_HAPPY, ANT_HAPPY, 0.5)
     print("   Done!")
 
 def show_sad():
     """Make the robot look sad..."""
     print("😢 Showing SAD emotion...")
 
-    # Sad = looking down dejectedly
-    # Negative pitch = looking down
-    head_pose = create_head_pose(
-        roll=0,
-        pitch=-20,  # Look DOWN 20 degrees (sad...)
-        yaw=0
-    )
-
-    # Move slowly for a droopy, sad feeling
-    mini.goto_target(
-        head=head_pose,        # Head looking down
-        antennas=[-0.8, -0.8], # Both antennas drooping down
-        duration=0.8           # Slower movement = more sadness
-    )
-    time.sleep(0.8)
+    # Sad = looking down dejectedly, both antennas drooping
+    # Move slowly for a droopy, sad feeling (slower = more sadness)
+    goto_and_wait(HEAD_SAD, ANT_SAD, 0.8)
     print("   Done!")
 
+def goto_and_wait(head, antennas, duration):
+    """Issue a goto_target and sleep only the remainder of its duration.
+
+    The RPC itself takes non-zero time; sleeping the full duration on
+    top of it makes the cadence drift across a sequence, so the dwell
+    is measured from before the call.
+    """
+    start = time.monotonic()
+    mini.goto_target(head=head, antennas=antennas, duration=duration)
+    time.sleep(max(0.0, duration - (time.monotonic() - start)))
+
+def play_keyframes(keyframes):
+    """Stream a keyframe table as one continuous motion.
+
+    goto_target returns immediately and a new call preempts the one in
+    flight, so each keyframe dwells for its own duration - that dwell is
+    what paces the trajectory.
+
+    A keyframe whose target matches the previous one skips the RPC
+    (re-sending an identical pose is pure motor-bus traffic) but still
+    holds its dwell, so sequence timing is unchanged.
+    """
+    last_target = None
+    for head, antennas, duration in keyframes:
+        # Poses and antenna arrays are module constants, so identity
+        # comparison suffices
+        target = (id(head), id(antennas))
+        if target != last_target:
+            goto_and_wait(head, antennas, duration)
+            last_target = target
+        else:
+            time.sleep(duration)
+
 def show_excited():
     """Make the robot look excited with fast wiggles!"""
     print("🤩 Showing EXCITED emotion!")
-
-    # Excited = fast nodding + antenna wiggling!
-    for i in range(3):  # Do this 3 times
-        # Nod up
-        head_up = create_head_pose(
-            roll=0,
-            pitch=10,  # Nod up (DEGREES!)
-            yaw=0
-        )
-        mini.goto_target(
-            head=head_up,
-            antennas=[1.0, -1.0],  # Antennas opposite
-            duration=0.2
-        )
-        time.sleep(0.2)
-
-        # Nod down
-        head_down = create_head_pose(
-            roll=0,
-            pitch=-10,  # Nod down (DEGREES!)
-            yaw=0
-        )
-        mini.goto_target(
-            head=head_down,
-            antennas=[-1.0, 1.0],  # Swap antennas
-            duration=0.2
-        )
-        time.sleep(0.2)
-
-    # Return to neutral
-    neutral_head = create_head_pose(0, 0, 0)
-    mini.goto_target(
-        head=neutral_head,
-        antennas=[0, 0],
-        duration=0.3
-    )
-    time.sleep(0.3)
+    play_keyframes(EXCITED_KEYFRAMES)
     print("   Done!")
 
 def show_curious():
     """Make the robot look curious - tilting and exploring!"""
     print("🤔 Showing CURIOUS emotion!")
-
-    # Curious = head tilting side to side (like a confused puppy!)
-    # Tilt right
-    head_right = create_head_pose(
-        roll=20,   # Tilt head RIGHT (DEGREES!)
-        pitch=5,   # Slight upward look (questioning)
-        yaw=0
-    )
-    mini.goto_target(
-        head=head_right,
-        antennas=[0.6, -0.3],  # One antenna up, curious!
-        duration=0.6
-    )
-    time.sleep(0.6)
-
-    # Tilt left
-    head_left = create_head_pose(
-        roll=-20,  # Tilt head LEFT (DEGREES!)
-        pitch=5,
-        yaw=0
-    )
-    mini.goto_target(
-        head=head_left,
-        antennas=[-0.3, 0.6],  # Swap antennas
-        duration=0.6
-    )
-    time.sleep(0.6)
-
-    # Tilt right again
-    mini.goto_target(
-        head=head_right,
-        antennas=[0.6, -0.3],
-        duration=0.6
-    )
-    time.sleep(0.6)
-
-    # Return to neutral
-    neutral_head = create_head_pose(0, 0, 0)
-    mini.goto_target(
-        head=neutral_head,
-        antennas=[0, 0],
-        duration=0.5
-    )
-    time.sleep(0.5)
+    play_keyframes(CURIOUS_KEYFRAMES)
     print("   Done!")
 
-# Main program loop - wait for keyboard input
-try:
+# Emotion dispatch table - maps keys to the functions above
+emotions = {
+    'h': show_happy,
+    's': show_sad,
+    'e': show_excited,
+    'c': show_curious,
+}
+
+# Emotions play on a single worker thread so the key loop keeps polling
+# stdin during the ~1.5 s gestures instead of blocking in their sleeps
+# (same pattern as the face-tracking demos). One worker means emotions
+# never overlap each other.
+emotion_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+emotion_future = None
+
+def run_key_loop():
+    """Dispatch emotions from single keypresses - no Enter needed!
+
+    stdin switches to cbreak mode so each keystroke arrives immediately,
+    and select() polls with a 10 ms timeout, leaving the main thread
+    free between keys instead of parked inside input() waiting for a
+    whole line. Emotions run on the worker, so keys pressed mid-gesture
+    are seen right away instead of after the gesture finishes.
+    """
+    global emotion_future
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    print("(keys take effect immediately - no Enter needed)")
+    try:
+        while True:
+            # 10 ms poll - returns as soon as a key is waiting
+            if not select.select([sys.stdin], [], [], 0.01)[0]:
+                continue
+
+            key = sys.stdin.read(1).lower()
+            if key == 'q':
+                # Let any in-flight gesture finish before quitting
+                emotion_executor.shutdown(wait=True)
+                return
+            elif key in emotions:
+                if emotion_future is None or emotion_future.done():
+                    emotion_future = emotion_executor.submit(emotions[key])
+                else:
+                    print("(still showing the previous emotion...)")
+            elif key.strip():
+                print("Invalid choice! Try h, s, e, c, or q")
+    finally:
+        # Always hand the terminal back in its original mode
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+def run_input_loop():
+    """Line-based fallback when stdin is not a terminal (pipes, IDEs)."""
     while True:
-        # Ask the user to press a key
         user_input = input("Choose emotion (h/s/e/c/q): ").lower()
-
-        # Call the right function based on what key was pressed
-        if user_input == 'h':
-            show_happy()
-        elif user_input == 's':
-            show_sad()
-        elif user_input == 'e':
-            show_excited()
-        elif user_input == 'c':
-            show_curious()
-        elif user_input == 'q':
-            print("\nGoodbye! 👋")
-            print("Disconnecting robot...")
-            # Force immediate exit, killing all threads
-            os._exit(0)
+        if user_input == 'q':
+            return
+        elif user_input in emotions:
+            emotions[user_input]()
+            print()  # Empty line for readability
         else:
             print("Invalid choice! Try h, s, e, c, or q")
 
-        print()  # Empty line for readability
+# Main program loop - wait for keyboard input. The robot closes via its
+# context manager on the way out, so motors are safed and SDK threads
+# shut down cleanly - os._exit skipped all of that and could drop a
+# goto_target in flight.
+try:
+    with mini:
+        if sys.stdin.isatty():
+            run_key_loop()
+        else:
+            run_input_loop()
+
+    print("\nGoodbye! 👋")
+    print("Robot disconnected cleanly.")
 
 except KeyboardInterrupt:
     print("\nGoodbye!")
@@ -20,11 +20,12 @@ Development vs Production:
 
 from reachy_mini import ReachyMini
 from reachy_mini.utils import create_head_pose
+import sys
 import time
-import os
 import subprocess
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 import speech_recognition as sr
 
 
@@ -47,6 +48,21 @@ Press a key to show emotion:
   q - Quit
 """
 
+# Static menus are emitted as one write each - a print() per line means
+# a stdout lock + write() syscall per line
+MODE_MENU = """Choose mode:
+  1 - Real Robot (wireless)
+  2 - Simulation (no robot needed)
+
+"""
+
+CONTROL_MODE_MENU = """
+🎮 Choose control mode:
+  1 - Keyboard control (h/s/e/c keys)
+  2 - Voice commands (speak emotions)
+
+"""
+
 # Speech phrases for each emotion
 SPEECH_PHRASES = {
     'happy': "I'm so happy!",
@@ -70,6 +86,12 @@ TEMP_SPEECH_DIR = Path(__file__).parent / "temp_speech"
 IS_REAL_ROBOT = False
 ROBOT_URL = "http://reachy-mini.local:8000"
 
+# One pooled session for all sound-effect API calls - a module-level
+# requests.post opens a fresh TCP connection per trigger, paying the
+# handshake every time instead of reusing the keep-alive connection
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 # Voice command keywords mapped to emotions
 VOICE_KEYWORDS = {
     'happy': 'happy',
@@ -87,13 +109,20 @@ VOICE_KEYWORDS = {
 # ============================================================
 
 def setup_speech_directory():
-    """Create temporary directory for speech files if it doesn't exist."""
+    """Create the speech cache and pre-generate every emotion WAV.
+
+    The phrases in SPEECH_PHRASES never change, so the TTS subprocess
+    cost (tens to hundreds of ms per launch) is paid once here instead
+    of on every emotion trigger.
+    """
     TEMP_SPEECH_DIR.mkdir(parents=True, exist_ok=True)
+    for emotion_name, phrase in SPEECH_PHRASES.items():
+        generate_speech(phrase, emotion_name)
 
 
 def generate_speech(text, emotion_name):
     """
-    Generate speech using macOS 'say' command and convert to WAV.
+    Generate speech as WAV using the macOS 'say' command.
 
     Args:
         text: The text to convert to speech
@@ -102,19 +131,22 @@ def generate_speech(text, emotion_name):
     Returns:
         Path: Path to the generated WAV file
     """
-    aiff_file = TEMP_SPEECH_DIR / f"{emotion_name}.aiff"
     wav_file = TEMP_SPEECH_DIR / f"{emotion_name}.wav"
 
-    # Generate speech using macOS 'say' command (outputs AIFF)
-    subprocess.run(
-        ['say', '-o', str(aiff_file), text],
-        check=True,
-        capture_output=True
-    )
+    # Files persist across runs - skip the subprocess if already cached
+    if wav_file.exists():
+        return wav_file
 
-    # Convert AIFF to WAV using ffmpeg (robot expects WAV)
+    # 'say' can write WAVE directly, so no AIFF intermediate and no
+    # second ffmpeg process per phrase
     subprocess.run(
-        ['ffmpeg', '-i', str(aiff_file), '-y', str(wav_file)],
+        [
+            'say',
+            '--file-format=WAVE',
+            '--data-format=LEF32@22050',
+            '-o', str(wav_file),
+            text,
+        ],
         check=True,
         capture_output=True
     )
@@ -124,30 +156,28 @@ def generate_speech(text, emotion_name):
 
 def play_speech(robot, emotion_name):
     """
-    Generate and play speech for a given emotion.
+    Play the pre-generated speech for a given emotion.
 
     Args:
         robot: ReachyMini robot instance
         emotion_name: Name of the emotion (key in SPEECH_PHRASES)
     """
-    try:
-        # Get the phrase for this emotion
-        phrase = SPEECH_PHRASES[emotion_name]
+    # No try/except here - the constant failure modes (missing media
+    # backend, missing WAVs) are validated once in init_robot, so the
+    # per-trigger path stays straight-line
+    phrase = SPEECH_PHRASES[emotion_name]
 
-        # Generate speech file
-        speech_file = generate_speech(phrase, emotion_name)
+    # WAVs are generated once in setup_speech_directory()
+    speech_file = TEMP_SPEECH_DIR / f"{emotion_name}.wav"
 
-        if IS_REAL_ROBOT:
-            # Use REST API for real robot (TODO: need to upload file first)
-            print(f"   🔊 '{phrase}' (TTS on real robot not yet implemented)")
-            # For now, skip TTS on real robot until we implement file upload
-        else:
-            # Play through Mac speakers in simulator
-            robot.media.play_sound(str(speech_file))
-            print(f"   🔊 '{phrase}'")
-
-    except Exception as e:
-        print(f"   ⚠️ Speech error: {e}")
+    if IS_REAL_ROBOT:
+        # Use REST API for real robot (TODO: need to upload file first)
+        print(f"   🔊 '{phrase}' (TTS on real robot not yet implemented)")
+        # For now, skip TTS on real robot until we implement file upload
+    else:
+        # Play through Mac speakers in simulator
+        robot.media.play_sound(str(speech_file))
+        print(f"   🔊 '{phrase}'")
 
 
 def play_sound_via_api(sound_path):
@@ -164,7 +194,7 @@ def play_sound_via_api(sound_path):
 
         # Try to play the sound via API
         # Note: This endpoint might not exist - need to check robot API
-        response = requests.post(url, json={"sound": str(sound_path)}, timeout=5)
+        response = SESSION.post(url, json={"sound": str(sound_path)}, timeout=5)
 
         if response.status_code == 200:
             return True
@@ -184,24 +214,22 @@ def play_sound_effect(robot, emotion_name):
         robot: ReachyMini robot instance
         emotion_name: Name of the emotion (key in SOUND_EFFECTS)
     """
-    try:
-        # Get the sound file for this emotion
-        sound_file = SOUND_EFFECTS[emotion_name]
-
-        if IS_REAL_ROBOT:
-            # Use REST API for real robot
-            success = play_sound_via_api(sound_file)
-            if success:
-                print(f"   🎵 Sound: {sound_file} (via API)")
-            else:
-                print(f"   ⚠️ Could not play sound via API")
+    # Straight-line like play_speech - setup errors surface once at
+    # init_robot, not wrapped per trigger
+    sound_file = SOUND_EFFECTS[emotion_name]
+
+    if IS_REAL_ROBOT:
+        # Use REST API for real robot (keeps its own error handling -
+        # the network can fail at any time, unlike local playback)
+        success = play_sound_via_api(sound_file)
+        if success:
+            print(f"   🎵 Sound: {sound_file} (via API)")
         else:
-            # Use SDK media backend for simulator
-            robot.media.play_sound(sound_file)
-            print(f"   🎵 Sound: {sound_file}")
-
-    except Exception as e:
-        print(f"   ⚠️ Sound effect error: {e}")
+            print(f"   ⚠️ Could not play sound via API")
+    else:
+        # Use SDK media backend for simulator
+        robot.media.play_sound(sound_file)
+        print(f"   🎵 Sound: {sound_file}")
 
 
 # ============================================================
@@ -384,14 +412,15 @@ def init_robot():
     """
     global IS_REAL_ROBOT
 
-    # Setup speech directory
+    # Setup speech directory and verify every phrase rendered - this is
+    # the one-time check that lets the play functions skip try/except
     setup_speech_directory()
+    for name in SPEECH_PHRASES:
+        assert (TEMP_SPEECH_DIR / f"{name}.wav").exists(), \
+            f"Missing speech WAV for '{name}'"
 
-    print(BANNER)
-    print("Choose mode:")
-    print("  1 - Real Robot (wireless)")
-    print("  2 - Simulation (no robot needed)")
-    print()
+    sys.stdout.write(BANNER + "\n" + MODE_MENU)
+    sys.stdout.flush()
 
     while True:
         mode = input("Enter 1 or 2: ").strip()
@@ -412,6 +441,9 @@ def init_robot():
             # Use default_no_video to avoid video streaming buffer issues
             robot = ReachyMini(localhost_only=True, media_backend="default_no_video")
             IS_REAL_ROBOT = False
+            # Simulator playback goes through robot.media - check it now
+            # so per-trigger calls don't have to
+            assert robot.media is not None, "Media backend unavailable"
             print("✅ Connected to simulator!")
             return robot
 
@@ -502,41 +534,41 @@ def run_voice_mode(robot):
 
 def main():
     """Main program loop - handles user input and emotion selection."""
-    # Initialize robot
+    # Initialize robot - closed via its context manager on the way out
+    # so motors are safed and SDK threads join; os._exit used to skip
+    # that teardown entirely
     robot = init_robot()
 
-    # Choose control mode
-    print("\n🎮 Choose control mode:")
-    print("  1 - Keyboard control (h/s/e/c keys)")
-    print("  2 - Voice commands (speak emotions)")
-    print()
-
-    while True:
-        control_mode = input("Enter 1 or 2: ").strip()
-
-        if control_mode == "1":
-            print("\n⌨️ Keyboard Control Mode")
-            print("🤖 Robot is ready to show emotions!")
-            try:
-                run_keyboard_mode(robot)
-                break
-            except KeyboardInterrupt:
-                print("\n\n👋 Goodbye!")
-                break
-
-        elif control_mode == "2":
-            try:
-                run_voice_mode(robot)
-                break
-            except KeyboardInterrupt:
-                print("\n\n👋 Goodbye!")
-                break
+    with robot:
+        # Choose control mode
+        sys.stdout.write(CONTROL_MODE_MENU)
+        sys.stdout.flush()
+
+        while True:
+            control_mode = input("Enter 1 or 2: ").strip()
+
+            if control_mode == "1":
+                print("\n⌨️ Keyboard Control Mode")
+                print("🤖 Robot is ready to show emotions!")
+                try:
+                    run_keyboard_mode(robot)
+                    break
+                except KeyboardInterrupt:
+                    print("\n\n👋 Goodbye!")
+                    break
+
+            elif control_mode == "2":
+                try:
+                    run_voice_mode(robot)
+                    break
+                except KeyboardInterrupt:
+                    print("\n\n👋 Goodbye!")
+                    break
 
-        else:
-            print("❌ Invalid choice! Enter 1 or 2")
+            else:
+                print("❌ Invalid choice! Enter 1 or 2")
 
     print("Disconnecting robot...")
-    os._exit(0)
 
 
 # ============================================================
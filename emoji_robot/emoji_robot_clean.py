@@ -7,8 +7,11 @@ Press keys to trigger different emotional expressions!
 
 from reachy_mini import ReachyMini
 from reachy_mini.utils import create_head_pose
+import numpy as np
+import sys
+import termios
 import time
-import os
+import tty
 
 
 # ============================================================
@@ -30,6 +33,42 @@ Press a key to show emotion:
   q - Quit
 """
 
+# Head poses never change between triggers - build each one at module
+# load so the emotion functions only issue goto_target calls
+HEAD_HAPPY = create_head_pose(roll=0, pitch=15, yaw=0)
+HEAD_SAD = create_head_pose(roll=0, pitch=-20, yaw=0)
+HEAD_UP = create_head_pose(roll=0, pitch=10, yaw=0)
+HEAD_DOWN = create_head_pose(roll=0, pitch=-10, yaw=0)
+HEAD_RIGHT = create_head_pose(roll=20, pitch=5, yaw=0)
+HEAD_LEFT = create_head_pose(roll=-20, pitch=5, yaw=0)
+HEAD_NEUTRAL = create_head_pose(0, 0, 0)
+
+# Antenna targets as arrays allocated once - the player hands them
+# straight to goto_target instead of building a fresh list per step
+ANT_HAPPY = np.array([0.8, 0.8], dtype=np.float32)
+ANT_SAD = np.array([-0.8, -0.8], dtype=np.float32)
+ANT_WIGGLE = np.array([1.0, -1.0], dtype=np.float32)
+ANT_WIGGLE_SWAP = np.array([-1.0, 1.0], dtype=np.float32)
+ANT_CURIOUS = np.array([0.6, -0.3], dtype=np.float32)
+ANT_CURIOUS_SWAP = np.array([-0.3, 0.6], dtype=np.float32)
+ANT_NEUTRAL = np.array([0.0, 0.0], dtype=np.float32)
+
+# Multi-step emotions as keyframe tables: (head pose, antennas, duration).
+# Built once at module load; the player streams them as one trajectory.
+EXCITED_KEYFRAMES = (
+    (HEAD_UP, ANT_WIGGLE, 0.2),
+    (HEAD_DOWN, ANT_WIGGLE_SWAP, 0.2),
+) * 3 + (
+    (HEAD_NEUTRAL, ANT_NEUTRAL, 0.3),
+)
+
+CURIOUS_KEYFRAMES = (
+    (HEAD_RIGHT, ANT_CURIOUS, 0.6),
+    (HEAD_LEFT, ANT_CURIOUS_SWAP, 0.6),
+    (HEAD_RIGHT, ANT_CURIOUS, 0.6),
+    (HEAD_NEUTRAL, ANT_NEUTRAL, 0.5),
+)
+
 
 # ============================================================
 # EMOTION FUNCTIONS
@@ -39,13 +78,7 @@ def show_happy(robot):
     """Express happiness - looking up with antennas raised."""
     print("😊 Showing HAPPY emotion!")
 
-    head_pose = create_head_pose(roll=0, pitch=15, yaw=0)
-    robot.goto_target(
-        head=head_pose,
-        antennas=[0.8, 0.8],
-        duration=0.5
-    )
-    time.sleep(0.5)
+    goto_and_wait(robot, HEAD_HAPPY, ANT_HAPPY, 0.5)
     print("   Done!")
 
 
@@ -53,63 +86,77 @@ def show_sad(robot):
     """Express sadness - looking down with droopy antennas."""
     print("😢 Showing SAD emotion...")
 
-    head_pose = create_head_pose(roll=0, pitch=-20, yaw=0)
-    robot.goto_target(
-        head=head_pose,
-        antennas=[-0.8, -0.8],
-        duration=0.8
-    )
-    time.sleep(0.8)
+    goto_and_wait(robot, HEAD_SAD, ANT_SAD, 0.8)
     print("   Done!")
 
 
+def goto_and_wait(robot, head, antennas, duration):
+    """Issue a goto_target and sleep only the remainder of its duration.
+
+    The RPC itself takes non-zero time; sleeping the full duration on
+    top of it makes the cadence drift across a sequence, so the dwell
+    is measured from before the call.
+    """
+    start = time.monotonic()
+    robot.goto_target(head=head, antennas=antennas, duration=duration)
+    time.sleep(max(0.0, duration - (time.monotonic() - start)))
+
+
+def play_keyframes(robot, keyframes):
+    """Stream a keyframe table as one continuous motion.
+
+    goto_target returns immediately and a new call preempts the one in
+    flight, so each keyframe dwells for its own duration - that dwell is
+    what paces the trajectory.
+
+    A keyframe whose target matches the previous one skips the RPC
+    (re-sending an identical pose is pure motor-bus traffic) but still
+    holds its dwell, so sequence timing is unchanged.
+    """
+    last_target = None
+    for head, antennas, duration in keyframes:
+        # Poses and antenna arrays are module constants, so identity
+        # comparison suffices
+        target = (id(head), id(antennas))
+        if target != last_target:
+            goto_and_wait(robot, head, antennas, duration)
+            last_target = target
+        else:
+            time.sleep(duration)
+
+
 def show_excited(robot):
     """Express excitement - fast nodding with wiggling antennas."""
     print("🤩 Showing EXCITED emotion!")
-
-    for _ in range(3):
-        # Nod up
-        head_up = create_head_pose(roll=0, pitch=10, yaw=0)
-        robot.goto_target(head=head_up, antennas=[1.0, -1.0], duration=0.2)
-        time.sleep(0.2)
-
-        # Nod down
-        head_down = create_head_pose(roll=0, pitch=-10, yaw=0)
-        robot.goto_target(head=head_down, antennas=[-1.0, 1.0], duration=0.2)
-        time.sleep(0.2)
-
-    # Return to neutral
-    neutral_head = create_head_pose(0, 0, 0)
-    robot.goto_target(head=neutral_head, antennas=[0, 0], duration=0.3)
-    time.sleep(0.3)
+    play_keyframes(robot, EXCITED_KEYFRAMES)
     print("   Done!")
 
 
 def show_curious(robot):
     """Express curiosity - tilting head side to side."""
     print("🤔 Showing CURIOUS emotion!")
+    play_keyframes(robot, CURIOUS_KEYFRAMES)
+    print("   Done!")
 
-    # Define head poses
-    head_right = create_head_pose(roll=20, pitch=5, yaw=0)
-    head_left = create_head_pose(roll=-20, pitch=5, yaw=0)
-
-    # Tilt right
-    robot.goto_target(head=head_right, antennas=[0.6, -0.3], duration=0.6)
-    time.sleep(0.6)
 
-    # Tilt left
-    robot.goto_target(head=head_left, antennas=[-0.3, 0.6], duration=0.6)
-    time.sleep(0.6)
+# ============================================================
+# INPUT
+# ============================================================
 
-    # Tilt right again
-    robot.goto_target(head=head_right, antennas=[0.6, -0.3], duration=0.6)
-    time.sleep(0.6)
+def read_key():
+    """Block until a single key is pressed and return it, no Enter needed.
 
-    # Return to neutral
-    neutral_head = create_head_pose(0, 0, 0)
-    robot.goto_target(head=neutral_head, antennas=[0, 0], duration=0.5)
-    time.sleep(0.5)
-    print("   Done!")
+    Puts the terminal in cbreak mode for the duration of the read so a
+    keypress dispatches immediately instead of waiting for a buffered
+    line, and always restores the original terminal settings.
+    """
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        return sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 
 # ============================================================
@@ -171,27 +218,39 @@ def main():
         'c': show_curious
     }
 
-    # Main interaction loop
-    try:
-        while True:
-            user_input = input("Choose emotion (h/s/e/c/q): ").lower().strip()
-
-            if user_input == 'q':
-                print("\n👋 Goodbye!")
-                print("Disconnecting robot...")
-                os._exit(0)
-
-            elif user_input in emotions:
-                emotions[user_input](robot)
-                print()  # Empty line for readability
-
-            else:
-                print("❌ Invalid choice! Try h, s, e, c, or q")
-
-    except KeyboardInterrupt:
-        print("\n\n👋 Goodbye!")
-        print("Disconnecting robot...")
-        os._exit(0)
+    # Main interaction loop. Closing the robot through its context
+    # manager safes the motors and joins SDK threads - os._exit used to
+    # skip both and could drop a goto_target in flight.
+    # Single-key dispatch when stdin is a terminal - emotions trigger on
+    # the keypress itself instead of after an Enter. Piped input falls
+    # back to line-based reads.
+    interactive = sys.stdin.isatty()
+
+    with robot:
+        try:
+            while True:
+                if interactive:
+                    print("Choose emotion (h/s/e/c/q): ", end="", flush=True)
+                    user_input = read_key().lower()
+                    print(user_input)  # Echo - cbreak mode suppresses it
+                else:
+                    user_input = input("Choose emotion (h/s/e/c/q): ").lower().strip()
+
+                if user_input == 'q':
+                    print("\n👋 Goodbye!")
+                    break
+
+                elif user_input in emotions:
+                    emotions[user_input](robot)
+                    print()  # Empty line for readability
+
+                else:
+                    print("❌ Invalid choice! Try h, s, e, c, or q")
+
+        except KeyboardInterrupt:
+            print("\n\n👋 Goodbye!")
+
+    print("Disconnecting robot...")
 
 
 # ============================================================
@@ -1,15 +1,40 @@
 import cv2
 from reachy_mini import ReachyMini
 
-try:
+# Windows already created by show_frame - kept alive between calls so a
+# caller displaying frames in a loop never pays the destroy/rebuild cost
+_windows = set()
+
+
+def show_frame(frame, win="Reachy", wait_ms=1):
+    """Display a frame in a persistent window.
+
+    The window is created once and reused on subsequent calls, and the
+    default waitKey(1) only pumps GUI events instead of blocking - so
+    this is safe to call from inside a demo loop. Pass wait_ms=0 to
+    block until a key is pressed (single-shot viewing).
+    """
+    if win not in _windows:
+        cv2.namedWindow(win, cv2.WINDOW_AUTOSIZE)
+        _windows.add(win)
+    cv2.imshow(win, frame)
+    cv2.waitKey(wait_ms)
+
+
+def main():
     with ReachyMini(localhost_only=False) as mini:
         frame = mini.media.get_frame()
         if frame is not None and frame.size > 0:
-            cv2.imshow("Reachy", frame)
-            cv2.waitKey(0)
+            # Single-shot: block until a key is pressed, then tear down
+            show_frame(frame, wait_ms=0)
             cv2.destroyAllWindows()
         else:
             print("Error: Could not retrieve frame from camera.")
+
+
+try:
+    if __name__ == "__main__":
+        main()
 except ModuleNotFoundError as e:
     if 'gst_signalling' in str(e):
         print("Error: Missing required module 'gst_signalling'.")
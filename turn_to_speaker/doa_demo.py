@@ -25,8 +25,12 @@ See README.md for deployment instructions and testing strategy.
 
 from reachy_mini import ReachyMini
 from reachy_mini.utils import create_head_pose
+import collections
+import sys
+import threading
 import time
 import math
+import numpy as np
 
 # ============================================================
 # CONSTANTS
@@ -38,9 +42,13 @@ REACHY MINI - DIRECTION OF ARRIVAL (DoA) DEMO
 ==================================================
 """
 
-# DoA sampling rate (how often to check for sound direction)
+# DoA sampling rate (how often the background sampler polls the array)
 DOA_SAMPLE_INTERVAL = 0.1  # seconds
 
+# Max wait per control-loop wakeup - keeps Ctrl+C responsive even if
+# the sampler thread stalls
+DOA_WAIT_TIMEOUT = 1.0  # seconds
+
 # Head yaw limits (degrees)
 MAX_YAW = 30.0  # Maximum turn left/right
 MIN_YAW = -30.0
@@ -48,6 +56,41 @@ MIN_YAW = -30.0
 # Speech detection threshold
 SPEECH_CONFIDENCE_THRESHOLD = 0.5  # Adjust if needed
 
+# Exponential smoothing weight for the DoA angle - applied on
+# (sin, cos) so the 359°→0° wrap averages correctly
+DOA_SMOOTHING_ALPHA = 0.3
+
+# Status-line cadence: always report a direction change, otherwise
+# refresh only every Nth batch - stdout writes steal cycles from the
+# 10 Hz loop on Pi-class hardware
+DOA_DISPLAY_EVERY = 10
+
+# Yaw for every whole DoA degree, precomputed once: normalize 0-360 to
+# -180..+180, scale down by 3 for a natural response, clamp to limits.
+# One array index per sample instead of branch + divide + clamp, and
+# the 1-degree quantization acts as a small built-in hysteresis.
+_YAW_LUT = np.clip(((np.arange(360) + 180) % 360 - 180) / 3.0, MIN_YAW, MAX_YAW)
+
+# Compass direction and arrow for every whole DoA degree - the 8-way
+# threshold chain and indicator dict collapse to one tuple index
+_DIRECTIONS = (
+    ("FRONT", "    ↑"),
+    ("FRONT-RIGHT", "   ↗"),
+    ("RIGHT", "    →"),
+    ("BACK-RIGHT", "   ↘"),
+    ("BACK", "    ↓"),
+    ("BACK-LEFT", "   ↙"),
+    ("LEFT", "    ←"),
+    ("FRONT-LEFT", "   ↖"),
+)
+_DIR_LUT = tuple(
+    _DIRECTIONS[int(((degree + 22.5) % 360) // 45)] for degree in range(360)
+)
+
+# Neutral head pose, built once - create_head_pose is pure, so the
+# Ctrl+C handler reuses this instead of rebuilding the matrix
+NEUTRAL_HEAD = create_head_pose(0, 0, 0)
+
 
 # ============================================================
 # HELPER FUNCTIONS
@@ -74,58 +117,55 @@ def angle_to_yaw(doa_angle):
     Returns:
         float: Robot head yaw in degrees, clamped to limits
     """
-    # Normalize angle to -180 to +180 range
-    if doa_angle > 180:
-        normalized = doa_angle - 360
-    else:
-        normalized = doa_angle
-
-    # Map to robot yaw (with some scaling for natural response)
-    # DoA ±90° should map to robot ±30° (full range)
-    yaw = normalized / 3.0  # Scale down for smoother response
-
-    # Clamp to robot limits
-    yaw = max(MIN_YAW, min(MAX_YAW, yaw))
-
-    return yaw
-
-
-def display_doa_info(doa_angle, is_speaking, yaw):
-    """Display DoA information in a readable format."""
-    # Determine direction description
-    if 337.5 <= doa_angle or doa_angle < 22.5:
-        direction = "FRONT"
-    elif 22.5 <= doa_angle < 67.5:
-        direction = "FRONT-RIGHT"
-    elif 67.5 <= doa_angle < 112.5:
-        direction = "RIGHT"
-    elif 112.5 <= doa_angle < 157.5:
-        direction = "BACK-RIGHT"
-    elif 157.5 <= doa_angle < 202.5:
-        direction = "BACK"
-    elif 202.5 <= doa_angle < 247.5:
-        direction = "BACK-LEFT"
-    elif 247.5 <= doa_angle < 292.5:
-        direction = "LEFT"
-    else:
-        direction = "FRONT-LEFT"
-
-    # Visual indicator based on direction
-    indicators = {
-        "FRONT": "    ↑",
-        "FRONT-RIGHT": "   ↗",
-        "RIGHT": "    →",
-        "BACK-RIGHT": "   ↘",
-        "BACK": "    ↓",
-        "BACK-LEFT": "   ↙",
-        "LEFT": "    ←",
-        "FRONT-LEFT": "   ↖"
-    }
-
-    indicator = indicators.get(direction, "")
-    speech_indicator = "🗣️ SPEAKING" if is_speaking else "🔇 Quiet"
-
-    print(f"{speech_indicator} | DoA: {doa_angle:3.0f}° | {direction:12s} {indicator} | Yaw: {yaw:+5.1f}°")
+    # All the arithmetic lives in _YAW_LUT, built once at import
+    return _YAW_LUT[int(doa_angle) % 360]
+
+
+# ============================================================
+# DoA SAMPLING
+# ============================================================
+
+def start_doa_sampler(audio):
+    """
+    Poll the DoA sensor on a daemon thread and signal new samples.
+
+    The SDK exposes DoA only as a poll API (get_DoA), so the polling
+    cadence lives here; the control loop blocks on the event and wakes
+    exactly when readings arrive instead of sleeping a fixed tick.
+
+    If the poll raises (device hiccup, disconnect), the exception is
+    appended as the final sample so the control loop re-raises it -
+    otherwise a dead sampler would leave the loop spinning on its
+    timeout forever, silently doing nothing.
+
+    Args:
+        audio: robot.media.audio interface
+
+    Returns:
+        tuple: (samples, doa_ready) - deque of pending readings, and
+        the event set whenever one is appended
+    """
+    samples = collections.deque()
+    doa_ready = threading.Event()
+
+    def sampler():
+        while True:
+            try:
+                # deque.append is atomic under the GIL - the control
+                # loop drains whatever accumulated since its last wakeup
+                samples.append(audio.get_DoA())
+            except Exception as exc:
+                # Hand the failure to the control loop and stop - it
+                # re-raises, so the demo exits loudly like a foreground
+                # poll would have
+                samples.append(exc)
+                doa_ready.set()
+                return
+            doa_ready.set()
+            time.sleep(DOA_SAMPLE_INTERVAL)
+
+    threading.Thread(target=sampler, daemon=True).start()
+    return samples, doa_ready
 
 
 # ============================================================
@@ -152,20 +192,68 @@ def run_doa_demo(robot):
 
     try:
         last_yaw = 0.0
+        ema_sin = None  # Circular EMA state, seeded by the first sample
+        ema_cos = None
+        last_direction = None  # Status-line state
+        batch_count = 0
 
-        while True:
-            # Get DoA data from ReSpeaker array
-            doa_data = robot.media.audio.get_DoA()
-
-            # Extract information
-            doa_angle = doa_data.get('angle', 0)  # Direction in degrees (0-360)
-            is_speaking = doa_data.get('is_speaking', False)  # Speech detected?
+        # Sampling runs on its own thread; this loop is event-driven
+        samples, doa_ready = start_doa_sampler(robot.media.audio)
 
-            # Convert DoA angle to robot head yaw
+        while True:
+            # Block until the sampler publishes - no fixed-tick sleep,
+            # no wakeups while nothing is happening
+            if not doa_ready.wait(timeout=DOA_WAIT_TIMEOUT):
+                continue
+            doa_ready.clear()
+
+            # Drain everything that accumulated since the last wakeup
+            # and act on the newest reading - one display line and at
+            # most one motor command per batch, however many samples
+            # queued up while the previous goto_target was in flight
+            batch = []
+            while samples:
+                sample = samples.popleft()
+                # A failed poll arrives as the exception itself -
+                # propagate it instead of spinning on a dead sampler
+                if isinstance(sample, Exception):
+                    raise sample
+                batch.append(sample)
+            if not batch:
+                continue
+
+            # Fold the whole batch into an exponential moving average on
+            # the angle's (sin, cos) - the circular mean, so jitter is
+            # damped without breaking at the 359°→0° wrap. Raw angles
+            # would fire the 5° motion guard on every noisy spike.
+            for sample in batch:
+                theta = math.radians(sample.get('angle', 0))
+                if ema_sin is None:
+                    ema_sin, ema_cos = math.sin(theta), math.cos(theta)
+                else:
+                    ema_sin += DOA_SMOOTHING_ALPHA * (math.sin(theta) - ema_sin)
+                    ema_cos += DOA_SMOOTHING_ALPHA * (math.cos(theta) - ema_cos)
+            doa_angle = math.degrees(math.atan2(ema_sin, ema_cos)) % 360
+
+            # Speech flag comes from the newest reading
+            is_speaking = batch[-1].get('is_speaking', False)
+
+            # Convert smoothed DoA angle to robot head yaw
             target_yaw = angle_to_yaw(doa_angle)
 
-            # Display current DoA information
-            display_doa_info(doa_angle, is_speaking, target_yaw)
+            # Report the reading as one buffered stdout write, and only
+            # when something worth reading happened: the direction
+            # bucket changed, or every Nth batch as a heartbeat
+            batch_count += 1
+            direction, indicator = _DIR_LUT[int(doa_angle) % 360]
+            if direction != last_direction or batch_count % DOA_DISPLAY_EVERY == 0:
+                last_direction = direction
+                speech_indicator = "🗣️ SPEAKING" if is_speaking else "🔇 Quiet"
+                sys.stdout.write(
+                    f"{speech_indicator} | DoA: {doa_angle:3.0f}° | "
+                    f"{direction:12s} {indicator} | Yaw: {target_yaw:+5.1f}°\n"
+                )
+                sys.stdout.flush()
 
             # Only move head if speech is detected and yaw changed significantly
             if is_speaking and abs(target_yaw - last_yaw) > 5.0:
@@ -185,16 +273,12 @@ def run_doa_demo(robot):
                 last_yaw = target_yaw
                 print(f"   → Turning head to {target_yaw:+5.1f}°")
 
-            # Sample at regular interval
-            time.sleep(DOA_SAMPLE_INTERVAL)
-
     except KeyboardInterrupt:
         print("\n\n👋 Stopping DoA demo...")
 
         # Return head to neutral position
         print("Returning to neutral position...")
-        neutral_head = create_head_pose(0, 0, 0)
-        robot.goto_target(head=neutral_head, duration=0.5)
+        robot.goto_target(head=NEUTRAL_HEAD, duration=0.5)
         time.sleep(0.5)
 
 